@@ -0,0 +1,59 @@
+"""
+Gemini 스트리밍 응답 가짜 객체 (test_*.py 공용, 네트워크 불필요)
+"""
+
+import json
+
+
+class FakeStreamResponse:
+    """iter_lines()로 SSE 줄을 돌려주는 requests.Response 대용"""
+
+    status_code = 200
+    text = ''
+
+    def __init__(self, events):
+        self.lines = []
+        for event in events:
+            self.lines.append(b'data: ' + json.dumps(event, ensure_ascii=False).encode('utf-8'))
+            self.lines.append(b'')  # SSE 이벤트 구분 빈 줄
+        self.consumed = 0
+        self.closed = False
+
+    def iter_lines(self):
+        for line in self.lines:
+            self.consumed += 1
+            yield line
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def text_event(*parts, finish_reason=None):
+    """parts: (text, thought) 튜플 목록으로 SSE 이벤트 생성"""
+    candidate = {'content': {'parts': [
+        {'text': text, 'thought': True} if thought else {'text': text}
+        for text, thought in parts
+    ]}}
+    if finish_reason:
+        candidate['finishReason'] = finish_reason
+    return {'candidates': [candidate]}
+
+
+def patch_gemini_post(app, respond):
+    """app._HTTP.post를 가짜 스트림으로 교체
+
+    Args:
+        app: fetch_6g_professional 모듈
+        respond: 프롬프트 텍스트를 받아 summaries 리스트를 돌려주는 함수
+    """
+    app.GEMINI_MIN_INTERVAL = 0  # 호출 간 대기 생략
+
+    def fake_post(url, data=None, **kwargs):
+        prompt = app.json_loads(data)['contents'][0]['parts'][0]['text']
+        body = json.dumps({'summaries': respond(prompt)}, ensure_ascii=False)
+        return FakeStreamResponse([text_event((body, False), finish_reason='STOP')])
+
+    app._HTTP.post = fake_post
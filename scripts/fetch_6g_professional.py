@@ -11,16 +11,110 @@ Note: Google Scholar removed due to bot detection (HTTP 429 + CAPTCHA)
 
 import os
 import json
+import time
+import sqlite3
+import hashlib
+import html
 import smtplib
+import atexit
+import functools
+import threading
+import difflib
+import unicodedata
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import io
+import urllib.robotparser
+from urllib.parse import urlsplit
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime
-from bs4 import BeautifulSoup
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 JSON 파싱/직렬화에 사용
+except ImportError:
+    orjson = None
+
+# ==================== 공통 설정 ====================
+
+# 스크래핑/피드 요청에 공통으로 사용하는 브라우저 헤더 (한 번만 생성)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 모듈 전역 HTTP 세션 (keep-alive + 커넥션 풀 재사용으로 매 요청 TLS 핸드셰이크 제거)
+# Retry 기본 설정은 멱등 메서드(GET 등)만 재시도하며, Gemini POST 재시도는 호출부에서 처리
+_HTTP = requests.Session()
+_HTTP.headers.update(DEFAULT_HEADERS)
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # 429/503의 Retry-After는 상한 없이 대기하므로 따르지 않음 (일일 작업이 멈추지 않도록 backoff만 사용)
+        respect_retry_after_header=False,
+        raise_on_status=False  # 재시도 소진 시 마지막 응답을 돌려줘 기존 raise_for_status 처리 유지
+    )
+)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
+# Gemini API는 post_gemini의 백오프 루프만 재시도 (어댑터 연결 재시도와 겹쳐 3x3회가 되지 않도록 재시도 없는 어댑터)
+_HTTP.mount('https://generativelanguage.googleapis.com/', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+# Gemini 호출 재시도 설정 (Rate limit / 일시적 서버 오류)
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_RETRY_STATUS = (429, 500, 502, 503, 504)
+# Gemini 호출 간 최소 간격 (초) - 고정 대기 대신 직전 호출 이후 부족한 시간만 대기
+GEMINI_MIN_INTERVAL = 2.0
+
+# Atom 피드 네임스페이스 (arXiv API)
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# arXiv API 전용 헤더 (API 권장사항에 따른 클라이언트 식별 UA, 압축은 requests 기본값 사용)
+ARXIV_HEADERS = {
+    'User-Agent': '6g-news-summarizer/1.0'
+}
 
 # ==================== 유틸리티 함수 ====================
 
+def json_loads(text):
+    """JSON 파싱 (orjson이 있으면 사용, 없으면 표준 json)
+
+    orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로
+    기존 except json.JSONDecodeError 처리가 그대로 동작합니다.
+
+    Args:
+        text: JSON 문자열 또는 UTF-8 바이트
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def json_dumps_bytes(value):
+    """요청 본문용 UTF-8 JSON 바이트 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+# 기본 URL 구조 검증 정규식 (모듈 로드 시 한 번만 컴파일)
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 def validate_and_clean_url(url):
     """URL 유효성 검증 및 정제
 
@@ -42,15 +136,7 @@ def validate_and_clean_url(url):
             return ''
 
         # 기본 URL 구조 검증 (정규식)
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        if not url_pattern.match(url):
+        if not _URL_PATTERN.match(url):
             return ''
 
         return url
@@ -59,6 +145,23 @@ def validate_and_clean_url(url):
         print(f"⚠️ URL 검증 오류: {str(e)[:50]}")
         return ''
 
+def iter_xml_elements(content, tag):
+    """XML 바이트에서 tag 요소를 스트리밍으로 순회
+
+    lxml.etree.iterparse로 요소가 완성될 때마다 반환하고, 처리가 끝난 요소는
+    즉시 비워서 전체 트리를 메모리에 유지하지 않습니다.
+
+    Args:
+        content: XML 응답 바이트
+        tag: 순회할 요소 태그 (네임스페이스 포함, 예: '{...}entry')
+    """
+    for _, elem in etree.iterparse(io.BytesIO(content), tag=tag):
+        yield elem
+        # 처리 완료된 요소와 앞선 형제 노드 해제
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
 def clean_json_string(text):
     """JSON 문자열에서 문제가 될 수 있는 특수문자 정제"""
     # 백슬래시와 따옴표 문제 해결
@@ -71,26 +174,354 @@ def clean_json_string(text):
 
     return text
 
+def json_loads_with_cleanup(json_text):
+    """Gemini 응답 JSON 파싱: 원문 그대로 먼저 시도하고, 실패할 때만 정제 후 재시도
+
+    정상 응답은 clean_json_string의 문자열 복사를 생략하고, 정제 과정에서
+    이스케이프된 따옴표(\\")가 깨지는 문제도 피합니다.
+
+    Raises:
+        json.JSONDecodeError: 정제 후에도 파싱 실패 시 (위치는 정제된 문자열 기준)
+    """
+    try:
+        return json_loads(json_text)
+    except json.JSONDecodeError:
+        return json_loads(clean_json_string(json_text))
+
+_gemini_last_call = 0.0
+_gemini_pace_lock = threading.Lock()
+
+def wait_for_gemini_slot():
+    """직전 Gemini 호출 후 GEMINI_MIN_INTERVAL이 지나지 않았을 때만 남은 시간만큼 대기"""
+    global _gemini_last_call
+    with _gemini_pace_lock:
+        wait = _gemini_last_call + GEMINI_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _gemini_last_call = time.monotonic()
+
+def post_gemini(url, payload, timeout=60, max_attempts=GEMINI_MAX_ATTEMPTS, stream=False):
+    """Gemini API POST 호출 (429/5xx 및 연결 오류 시 지수 백오프 재시도)
+
+    Args:
+        url: generateContent / streamGenerateContent 엔드포인트 URL
+        payload: 요청 JSON
+        timeout: 요청 타임아웃 (초)
+        max_attempts: 최대 시도 횟수
+        stream: True면 본문을 미리 읽지 않고 스트리밍 응답으로 반환
+
+    Returns:
+        requests.Response: 마지막 시도의 응답 (상태 코드 확인은 호출부에서)
+    """
+    # 요청 본문은 한 번만 직렬화해서 재시도마다 재사용 (orjson이 있으면 사용)
+    body = json_dumps_bytes(payload)
+
+    for attempt in range(max_attempts):
+        is_last = attempt == max_attempts - 1
+        wait = 5 * (2 ** attempt)  # 5초, 10초, ...
+
+        try:
+            wait_for_gemini_slot()
+            response = _HTTP.post(
+                url,
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=timeout,
+                stream=stream
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if is_last:
+                raise
+            print(f"⚠️ Gemini 연결 오류 ({type(e).__name__}). {wait}초 대기 후 재시도...")
+            time.sleep(wait)
+            continue
+
+        if response.status_code in GEMINI_RETRY_STATUS and not is_last:
+            print(f"⚠️ Gemini HTTP {response.status_code}. {wait}초 대기 후 재시도...")
+            response.close()
+            time.sleep(wait)
+            continue
+
+        return response
+
+def is_json_complete(text):
+    """텍스트 안의 첫 최상위 JSON 객체/배열이 괄호까지 닫혔는지 확인 (문자열 내부 괄호는 무시)"""
+    depth = 0
+    in_string = False
+    escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = depth > 0
+        elif ch in '{[':
+            depth += 1
+        elif ch in '}]' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return True
+    return False
+
+def read_gemini_stream(response):
+    """streamGenerateContent(SSE) 응답의 텍스트 조각을 이어 붙여 반환
+
+    최상위 JSON이 닫히는 즉시 남은 스트림을 기다리지 않고 연결을 닫습니다.
+
+    Args:
+        response: stream=True로 받은 requests.Response
+
+    Returns:
+        tuple: (응답 텍스트, finishReason)
+    """
+    chunks = []
+    finish_reason = 'UNKNOWN'
+    try:
+        for raw_line in response.iter_lines():
+            # SSE 이벤트: "data: {...}" (text/event-stream은 charset이 없어 UTF-8 바이트 그대로 파싱)
+            if not raw_line.startswith(b'data:'):
+                continue
+            event = json_loads(raw_line[5:])
+
+            candidates = event.get('candidates') or []
+            if not candidates:
+                continue
+            candidate = candidates[0]
+            finish_reason = candidate.get('finishReason', finish_reason)
+
+            for part in candidate.get('content', {}).get('parts', []):
+                if part.get('text') and not part.get('thought'):
+                    chunks.append(part['text'])
+
+            last = chunks[-1] if chunks else ''
+            if ('}' in last or ']' in last) and is_json_complete(''.join(chunks)):
+                if finish_reason == 'UNKNOWN':
+                    finish_reason = 'JSON_COMPLETE'
+                break
+    finally:
+        response.close()
+
+    return ''.join(chunks), finish_reason
+
+# 마크다운 코드블록 표시 (여는/닫는 ``` 모두 매칭)
+_CODE_FENCE_RE = re.compile(r'```(?:json|python)?\s*')
+
+def _slice_between(text, open_char, close_char):
+    """첫 open_char부터 마지막 close_char까지 잘라 반환 (없으면 None)
+
+    정규식 '\\[.*\\]'(DOTALL, 탐욕적)와 같은 범위를 find/rfind 두 번으로 구함.
+    """
+    start = text.find(open_char)
+    if start == -1:
+        return None
+    end = text.rfind(close_char)
+    if end < start:
+        return None
+    return text[start:end + 1]
+
 def extract_json_from_text(text):
     """텍스트에서 JSON 객체/배열 추출"""
-    # 마크다운 코드블록 제거
-    text = re.sub(r'```(?:json|python)?\s*', '', text)
-    text = text.replace('```', '')
+    # 마크다운 코드블록 제거 (responseMimeType=JSON 응답에는 보통 없으므로 있을 때만)
+    if '```' in text:
+        text = _CODE_FENCE_RE.sub('', text)
 
-    # JSON 배열 찾기 [...]
-    array_match = re.search(r'\[[\s\S]*\]', text)
-    if array_match:
-        return array_match.group(0).strip()
-
-    # JSON 객체 찾기 {...}
-    obj_match = re.search(r'\{[\s\S]*\}', text)
-    if obj_match:
-        return obj_match.group(0).strip()
+    # JSON 배열 찾기 [...] → 없으면 JSON 객체 찾기 {...}
+    for open_char, close_char in (('[', ']'), ('{', '}')):
+        candidate = _slice_between(text, open_char, close_char)
+        if candidate is not None:
+            return candidate
 
     return text.strip()
 
+# ==================== 호스트별 요청 제한 ====================
+
+# 호스트당 최대 동시 요청 수 (병렬 수집 시 동일 서버에 몰리는 요청 제한 → 429 방지)
+HOST_MAX_CONCURRENCY = 3
+
+# robots.txt Crawl-delay를 확인할 호스트 (피드/스크래핑 대상만)
+# IEEE/arXiv API 호스트는 실행당 한 번만 호출하므로 robots.txt 왕복을 추가하지 않음
+ROBOTS_CHECK_HOSTS = frozenset({
+    'news.google.com',
+    'www.theverge.com',
+    'scholar.google.com',
+})
+ROBOTS_TIMEOUT = 3  # robots.txt 조회 타임아웃 (초, 재시도 없음)
+
+_host_limits = {}  # host -> 동시성 세마포어, robots.txt Crawl-delay, 마지막 요청 시각
+_host_limits_lock = threading.Lock()
+
+def _get_host_limit(scheme, host):
+    """호스트별 제한 상태 반환 (최초 접근 시 생성)"""
+    with _host_limits_lock:
+        limit = _host_limits.get(host)
+        if limit is None:
+            limit = {
+                'semaphore': threading.BoundedSemaphore(HOST_MAX_CONCURRENCY),
+                'lock': threading.Lock(),
+                'crawl_delay': None,
+                'robots_checked': False,
+                'last_request': 0.0,
+            }
+            _host_limits[host] = limit
+
+    # robots.txt는 대상 호스트만, 호스트당 한 번만 조회
+    with limit['lock']:
+        if not limit['robots_checked']:
+            if host in ROBOTS_CHECK_HOSTS:
+                limit['crawl_delay'] = _fetch_crawl_delay(scheme, host)
+            limit['robots_checked'] = True
+    return limit
+
+def _fetch_crawl_delay(scheme, host):
+    """robots.txt의 Crawl-delay 값 조회 (없거나 실패 시 None)
+
+    호스트 잠금을 잡은 채 호출되므로 재시도하는 공유 세션(_HTTP) 대신
+    재시도 없는 단발 요청으로, 느린 호스트에서도 짧게 끝나도록 합니다.
+    """
+    parser = urllib.robotparser.RobotFileParser()
+    try:
+        response = requests.get(
+            f"{scheme}://{host}/robots.txt",
+            headers=DEFAULT_HEADERS,
+            timeout=ROBOTS_TIMEOUT
+        )
+        parser.parse(response.text.splitlines() if response.status_code == 200 else [])
+        delay = parser.crawl_delay('*')
+    except Exception:
+        return None
+
+    if delay:
+        print(f"🤖 {host} robots.txt Crawl-delay: {delay}초")
+    return delay
+
+def http_get(url, **kwargs):
+    """호스트별 동시성 제한과 robots.txt Crawl-delay를 지키는 GET 요청
+
+    Args:
+        url: 요청 URL
+        **kwargs: requests.Session.get에 그대로 전달
+
+    Returns:
+        requests.Response
+    """
+    parts = urlsplit(url)
+    limit = _get_host_limit(parts.scheme, parts.netloc)
+
+    with limit['semaphore']:
+        if limit['crawl_delay']:
+            # Crawl-delay가 있는 호스트는 직전 요청과의 간격 보장
+            with limit['lock']:
+                wait = limit['last_request'] + limit['crawl_delay'] - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                limit['last_request'] = time.monotonic()
+        return _HTTP.get(url, **kwargs)
+
+# ==================== 디스크 캐시 ====================
+
+# 같은 날 재실행(GitHub Actions re-run 등) 시 검색/요약 결과를 재사용하기 위한 SQLite 캐시
+CACHE_DIR = os.environ.get('CACHE_DIR', '.cache')
+CACHE_DB = os.path.join(CACHE_DIR, '6g_cache.sqlite3')
+SEARCH_CACHE_TTL = 6 * 3600   # 검색 결과 캐시 유효 시간 (6시간)
+SUMMARY_CACHE_TTL = 6 * 3600  # Gemini 요약 캐시 유효 시간 (6시간)
+ITEM_SUMMARY_CACHE_TTL = 24 * 3600  # URL별 요약 캐시 유효 시간 (24시간, 전날 기사 재요약 방지)
+GEMINI_PROMPT_CACHE_TTL = 24 * 3600  # 키워드 추출/아이템 선별 결과 캐시 (프롬프트 해시 기준, 24시간)
+FEED_CACHE_TTL = 7 * 24 * 3600  # 피드 본문 + ETag/Last-Modified 보관 (7일, 조건부 요청용)
+DELIVERY_CACHE_TTL = 7 * 24 * 3600  # 마지막으로 전송한 리포트 해시 보관 (7일, 같은 내용 재전송 방지)
+
+_cache_conn = None
+_cache_lock = threading.Lock()  # 검색 함수가 여러 스레드에서 동시에 실행됨
+
+def _cache_enabled():
+    """DISABLE_CACHE=1 이면 캐시 비활성화"""
+    return os.environ.get('DISABLE_CACHE', '').lower() not in ('1', 'true', 'yes')
+
+def _get_cache_conn():
+    """캐시 DB 연결을 지연 생성 (만료된 항목은 연결 시 정리)"""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        conn.commit()
+        _cache_conn = conn
+    return _cache_conn
+
+def make_cache_key(*parts):
+    """캐시 키 생성 (입력값의 JSON 직렬화에 대한 blake2b 해시)"""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=20).hexdigest()
+
+def cache_get(key):
+    """캐시 조회
+
+    Returns:
+        저장된 값 (없거나 만료되었으면 None)
+    """
+    if not _cache_enabled():
+        return None
+
+    try:
+        with _cache_lock:
+            row = _get_cache_conn().execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+        return json_loads(row[0]) if row else None
+    except Exception as e:
+        print(f"⚠️ 캐시 조회 오류: {e}")
+        return None
+
+def cache_set(key, value, ttl):
+    """캐시 저장 (ttl초 동안 유효)"""
+    if not _cache_enabled():
+        return
+
+    try:
+        with _cache_lock:
+            conn = _get_cache_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time() + ttl)
+            )
+            conn.commit()
+    except Exception as e:
+        print(f"⚠️ 캐시 저장 오류: {e}")
+
+def disk_cached(ttl):
+    """함수 결과를 디스크에 캐시하는 데코레이터 (키 = 함수명 + 인자)
+
+    빈 결과(검색 실패 등)는 저장하지 않아 다음 실행에서 다시 시도합니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_cache_key(func.__name__, args, kwargs)
+            cached = cache_get(key)
+            if cached is not None:
+                print(f"💾 캐시 사용: {func.__name__} ({len(cached)}개)")
+                return cached
+
+            result = func(*args, **kwargs)
+            if result:
+                cache_set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
 # ==================== Hot Keyword 추출 ====================
 
+# 키워드 응답에서 따옴표 제거용 테이블
+_QUOTE_STRIP_TABLE = str.maketrans('', '', '"\'')
+
 def extract_hot_keywords():
     """Gemini를 사용하여 오늘의 6G hot keywords 추출"""
 
@@ -137,20 +568,20 @@ Example outputs:
         }
     }
 
+    # 같은 프롬프트(날짜 포함)로 이미 추출한 키워드가 있으면 Gemini 호출 생략
+    cache_key = make_cache_key('extract_hot_keywords', prompt)
+    cached = cache_get(cache_key)
+    if cached:
+        print(f"💾 캐시된 Hot Keyword 사용: '{cached}'")
+        return cached
+
     try:
         print("🔍 Gemini로 오늘의 Hot Keyword 추출 중...")
-        response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=30)
-
-        # 429 Rate Limit 처리
-        if response.status_code == 429:
-            print("⚠️ Rate limit 도달. 5초 대기 후 재시도...")
-            import time
-            time.sleep(5)
-            response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=30)
-
+        # 429/5xx 및 연결 오류는 post_gemini가 지수 백오프로 재시도
+        response = post_gemini(url, payload, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = json_loads(response.content)
 
         # 디버깅: API 응답 구조 확인
         print(f"📝 Gemini API 응답 키: {list(data.keys())}")
@@ -170,10 +601,11 @@ Example outputs:
                 content = candidate['content']
                 if 'parts' in content and len(content['parts']) > 0:
                     keyword = content['parts'][0].get('text', '').strip()
-                    keyword = keyword.replace('"', '').replace("'", "").strip()
+                    keyword = keyword.translate(_QUOTE_STRIP_TABLE).strip()
 
                     if keyword:
                         print(f"✅ Hot Keyword: '{keyword}'")
+                        cache_set(cache_key, keyword, GEMINI_PROMPT_CACHE_TTL)
                         return keyword
                     else:
                         print("⚠️ 키워드가 비어있음.")
@@ -194,6 +626,16 @@ Example outputs:
 
 # ==================== 검색 함수 ====================
 
+def _has_class_xpath(class_name):
+    """class 속성에 class_name 토큰이 있는지 검사하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Google Scholar 결과 파싱용 XPath (모듈 로드 시 한 번만 컴파일, 첫 매치만 필요한 곳은 [1]로 조기 종료)
+_SCHOLAR_RESULTS_XPATH = etree.XPath(f"(//div[{_has_class_xpath('gs_ri')}])[position() <= $limit]")
+_SCHOLAR_TITLE_XPATH = etree.XPath(f"(.//h3[{_has_class_xpath('gs_rt')}])[1]")
+_SCHOLAR_SNIPPET_XPATH = etree.XPath(f"(.//div[{_has_class_xpath('gs_rs')}])[1]")
+
+@disk_cached(ttl=SEARCH_CACHE_TTL)
 def search_google_scholar(query, num_results=5):
     """Google Scholar에서 6G 논문 검색 (Papers)"""
     
@@ -202,29 +644,27 @@ def search_google_scholar(query, num_results=5):
     # Google Scholar RSS/API 대안으로 일반 검색 사용
     search_url = f"https://scholar.google.com/scholar?q={query}&hl=en&as_sdt=0,5"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = http_get(search_url, timeout=10)
+        # lxml HTML 파서로 직접 파싱 (BeautifulSoup html.parser 대비 C 레벨 파싱)
+        tree = lxml_html.fromstring(response.content)
         
         results = []
-        papers = soup.find_all('div', class_='gs_ri', limit=num_results)
+        papers = _SCHOLAR_RESULTS_XPATH(tree, limit=num_results)
         
         for paper in papers:
-            title_elem = paper.find('h3', class_='gs_rt')
-            snippet_elem = paper.find('div', class_='gs_rs')
+            title_elems = _SCHOLAR_TITLE_XPATH(paper)
+            snippet_elems = _SCHOLAR_SNIPPET_XPATH(paper)
             
-            if title_elem:
+            if title_elems:
+                title_elem = title_elems[0]
                 # 제목에서 링크 추출
-                link_elem = title_elem.find('a')
-                title = title_elem.get_text()
-                url = link_elem['href'] if link_elem and link_elem.has_attr('href') else ''
+                link_elem = title_elem.find('.//a')
+                title = title_elem.text_content()
+                url = link_elem.get('href', '') if link_elem is not None else ''
                 
                 # 초록 추출
-                snippet = snippet_elem.get_text() if snippet_elem else ''
+                snippet = snippet_elems[0].text_content() if snippet_elems else ''
                 
                 results.append({
                     'title': title.strip(),
@@ -240,12 +680,13 @@ def search_google_scholar(query, num_results=5):
         print(f"❌ Google Scholar 검색 오류: {e}")
         return []
 
+@disk_cached(ttl=SEARCH_CACHE_TTL)
 def search_arxiv(query, num_results=5):
     """arXiv에서 6G 논문 검색 (Papers)"""
     
     print(f"📄 arXiv 검색 중: {query}")
     
-    url = "http://export.arxiv.org/api/query"
+    url = "https://export.arxiv.org/api/query"
     params = {
         'search_query': f'all:{query}',
         'start': 0,
@@ -255,16 +696,14 @@ def search_arxiv(query, num_results=5):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        soup = BeautifulSoup(response.content, 'xml')
+        response = http_get(url, params=params, headers=ARXIV_HEADERS, timeout=10)
+        response.raise_for_status()
         
         results = []
-        entries = soup.find_all('entry')
-        
-        for entry in entries:
-            title = entry.find('title').get_text().strip()
-            summary = entry.find('summary').get_text().strip()
-            link = entry.find('id').get_text().strip()
+        for entry in iter_xml_elements(response.content, f'{ATOM_NS}entry'):
+            title = entry.findtext(f'{ATOM_NS}title', '').strip()
+            summary = entry.findtext(f'{ATOM_NS}summary', '').strip()
+            link = entry.findtext(f'{ATOM_NS}id', '').strip()
             
             results.append({
                 'title': title,
@@ -272,6 +711,8 @@ def search_arxiv(query, num_results=5):
                 'url': link,
                 'type': 'Paper'
             })
+            if len(results) >= num_results:
+                break  # 필요한 개수만큼 모이면 나머지 XML은 파싱하지 않음
         
         print(f"✅ {len(results)}개 논문 발견")
         return results
@@ -280,6 +721,7 @@ def search_arxiv(query, num_results=5):
         print(f"❌ arXiv 검색 오류: {e}")
         return []
 
+@disk_cached(ttl=SEARCH_CACHE_TTL)
 def search_ieee(query, num_results=5, api_key=None):
     """IEEE Xplore API를 사용한 검색 (Journals)"""
 
@@ -306,10 +748,10 @@ def search_ieee(query, num_results=5, api_key=None):
     }
 
     try:
-        response = requests.get(api_url, params=params, timeout=15)
+        response = http_get(api_url, params=params, timeout=15)
         response.raise_for_status()
 
-        data = response.json()
+        data = json_loads(response.content)
 
         results = []
         articles = data.get('articles', [])
@@ -345,6 +787,140 @@ def search_ieee(query, num_results=5, api_key=None):
         print(f"❌ IEEE 검색 오류: {e}")
         return []
 
+def fetch_feed(url):
+    """RSS/Atom 피드 다운로드 (HTTP 오류 시 예외 발생)
+
+    이전 응답의 ETag/Last-Modified가 캐시에 있으면 조건부 요청을 보내고,
+    304 Not Modified이면 본문을 다시 받지 않고 캐시된 본문을 사용합니다.
+
+    Returns:
+        bytes: 피드 XML 본문
+    """
+    cache_key = make_cache_key('feed', url)
+    cached = cache_get(cache_key)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = http_get(url, headers=headers, timeout=10)
+    if response.status_code == 304 and cached:
+        print(f"♻️ 피드 변경 없음 (304), 캐시된 본문 사용: {urlsplit(url).netloc}")
+        return cached['body'].encode('latin-1')
+    response.raise_for_status()
+
+    # 검증자가 있는 응답만 저장 (latin-1은 바이트를 그대로 문자로 옮기므로 무손실)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        cache_set(cache_key, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': response.content.decode('latin-1')
+        }, FEED_CACHE_TTL)
+    return response.content
+
+def collect_recent_feed_items(entries, num_results, days, get_pub_date, parse_date,
+                              extract, skip_unparsable_date):
+    """피드 항목 공통 처리: 최근 N일 필터 → 필드 추출 → URL 검증 → 최대 개수 제한
+
+    Args:
+        entries: 피드 항목(요소) iterable
+        num_results: 반환할 최대 결과 수
+        days: 검색할 기간 (일)
+        get_pub_date: 항목 → 발행일 문자열
+        parse_date: 발행일 문자열 → datetime
+        extract: 항목 → {'title', 'description', 'url'} (날짜 필터를 통과한 항목만 호출)
+        skip_unparsable_date: 발행일 파싱 실패 시 건너뛸지 여부 (False면 포함)
+
+    Returns:
+        list: News 아이템 리스트
+    """
+    # 날짜 필터링을 위한 현재 시간
+    cutoff_date = datetime.now() - timedelta(days=days)
+
+    results = []
+    for entry in entries:
+        if len(results) >= num_results:
+            break
+
+        # 발행 날짜 확인
+        pub_date_str = get_pub_date(entry)
+        if pub_date_str:
+            try:
+                # 날짜 비교 (timezone-aware 비교)
+                if parse_date(pub_date_str).replace(tzinfo=None) < cutoff_date:
+                    continue  # N일 이전 기사는 건너뛰기
+            except Exception as e:
+                print(f"⚠️ 날짜 파싱 오류: {pub_date_str[:30]}... - {e}")
+                if skip_unparsable_date:
+                    continue
+
+        item = extract(entry)
+
+        # Validate and clean the URL (유효하지 않으면 건너뛰기)
+        validated_url = validate_and_clean_url(item['url'])
+        if not validated_url:
+            print(f"⚠️ 유효하지 않은 URL 건너뛰기: {item['title'] or 'No title'}...")
+            continue
+
+        item['url'] = validated_url
+        item['pub_date'] = pub_date_str
+        item['type'] = 'News'
+        results.append(item)
+
+    return results
+
+def _parse_iso_date(date_str):
+    """ISO 8601 형식 파싱 (예: "2023-12-27T10:30:00Z")"""
+    from dateutil import parser
+    return parser.isoparse(date_str)
+
+def _extract_verge_entry(entry):
+    """The Verge Atom <entry>(lxml 요소)에서 제목/설명/링크 추출"""
+    title = entry.findtext(f'{ATOM_NS}title', '')
+    summary_elem = entry.find(f'{ATOM_NS}summary')
+    content_elem = entry.find(f'{ATOM_NS}content')
+
+    # Get description from summary or content
+    # (빈 <summary/>는 건너뛰고 content 사용 - BeautifulSoup 시절 `if summary_elem:`와 동일한 동작)
+    description = ''
+    summary_text = ''.join(summary_elem.itertext()) if summary_elem is not None else ''
+    if summary_text.strip():
+        description = summary_text
+    elif content_elem is not None:
+        # Content might have HTML, extract text (lxml.html: C 레벨 파싱)
+        content_html = ''.join(content_elem.itertext())
+        if content_html.strip():
+            description = lxml_html.fromstring(content_html).text_content()
+
+    # Get URL from link (rel="alternate" 우선, 없으면 첫 번째 link)
+    links = entry.findall(f'{ATOM_NS}link')
+    link_elem = next((link for link in links if link.get('rel') == 'alternate'), links[0] if links else None)
+
+    return {
+        'title': title,
+        'description': description[:500] if description else 'No description',
+        'url': link_elem.get('href') if link_elem is not None else ''
+    }
+
+def _extract_google_news_item(item):
+    """Google News RSS <item>에서 제목/설명/링크 추출
+
+    Google News RSS provides redirect URLs (news.google.com/rss/articles/...) in <link>
+    that redirect to the actual article when clicked.
+    Note: <source url> only contains homepage URLs, not actual article URLs
+    """
+    return {
+        'title': item.findtext('title', ''),
+        'description': item.findtext('description', ''),
+        'url': item.findtext('link', '')
+    }
+
+@disk_cached(ttl=SEARCH_CACHE_TTL)
 def search_the_verge(query, num_results=5, days=7):
     """The Verge Atom 피드 검색 (News) - 최근 N일 이내 기사만 검색
 
@@ -360,79 +936,14 @@ def search_the_verge(query, num_results=5, days=7):
     url = "https://www.theverge.com/rss/index.xml"
 
     try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=10)
-        response.raise_for_status()
-
-        # Parse as XML (Atom format)
-        soup = BeautifulSoup(response.content, 'xml')
-        entries = soup.find_all('entry')
-
-        # 날짜 필터링을 위한 현재 시간
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        # Filter by query keywords and limit results
-        results = []
-        query_lower = query.lower()
-
-        for entry in entries:
-            if len(results) >= num_results:
-                break
-
-            # 발행 날짜 확인
-            pub_date_str = entry.find('published').text if entry.find('published') else ''
-            if pub_date_str:
-                try:
-                    # ISO 8601 형식 파싱 (예: "2023-12-27T10:30:00Z")
-                    from dateutil import parser
-                    pub_date = parser.isoparse(pub_date_str)
-
-                    # 날짜 비교 (timezone-aware 비교)
-                    if pub_date.replace(tzinfo=None) < cutoff_date:
-                        continue  # 1주일 이전 기사는 건너뛰기
-                except Exception as e:
-                    print(f"⚠️ 날짜 파싱 오류: {pub_date_str[:30]}... - {e}")
-                    # 날짜 파싱 실패 시에는 포함 (보수적 접근)
-                    pass
-
-            title = entry.find('title').text if entry.find('title') else ''
-            summary_elem = entry.find('summary')
-            content_elem = entry.find('content')
-
-            # Get description from summary or content
-            description = ''
-            if summary_elem:
-                description = summary_elem.text
-            elif content_elem:
-                # Content might have HTML, extract text
-                description = BeautifulSoup(content_elem.text, 'html.parser').get_text()
-
-            # Get URL from link
-            link_elem = entry.find('link', {'rel': 'alternate'})
-            if not link_elem:
-                link_elem = entry.find('link')
-            url = link_elem.get('href') if link_elem else ''
-
-            # Simple keyword filtering (check if any query word is in title or description)
-            query_words = query_lower.split()
-            text_to_search = (title + ' ' + description).lower()
-
-            # If query matches or we don't have enough results yet
-            if any(word in text_to_search for word in query_words) or len(results) < num_results:
-                # Validate URL
-                validated_url = validate_and_clean_url(url)
-                if not validated_url:
-                    continue
-
-                results.append({
-                    'title': title,
-                    'description': description[:500] if description else 'No description',
-                    'url': validated_url,
-                    'pub_date': pub_date_str,
-                    'type': 'News'
-                })
+        # Atom 피드를 lxml로 스트리밍 파싱 (BeautifulSoup 'xml' 트리 생성 생략)
+        results = collect_recent_feed_items(
+            iter_xml_elements(fetch_feed(url), f'{ATOM_NS}entry'), num_results, days,
+            get_pub_date=lambda entry: entry.findtext(f'{ATOM_NS}published', ''),
+            parse_date=_parse_iso_date,
+            extract=_extract_verge_entry,
+            skip_unparsable_date=False  # 날짜 파싱 실패 시에는 포함 (보수적 접근)
+        )
 
         print(f"✅ {len(results)}개 뉴스 발견 (최근 {days}일 이내)")
         return results
@@ -441,6 +952,7 @@ def search_the_verge(query, num_results=5, days=7):
         print(f"❌ The Verge 검색 오류: {e}")
         return []
 
+@disk_cached(ttl=SEARCH_CACHE_TTL)
 def search_google_news(query, num_results=5, days=7):
     """Google 뉴스 검색 (News) - 최근 N일 이내 기사만 검색
 
@@ -455,59 +967,13 @@ def search_google_news(query, num_results=5, days=7):
     url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
 
     try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('item')
-
-        # 날짜 필터링을 위한 현재 시간
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        results = []
-        for item in items:
-            if len(results) >= num_results:
-                break
-
-            # 발행 날짜 확인
-            pub_date_str = item.pubDate.text if item.pubDate else ''
-            if pub_date_str:
-                try:
-                    # RFC 2822 형식 파싱 (예: "Wed, 27 Dec 2023 10:30:00 GMT")
-                    from email.utils import parsedate_to_datetime
-                    pub_date = parsedate_to_datetime(pub_date_str)
-
-                    # 날짜 비교 (timezone-aware 비교)
-                    if pub_date.replace(tzinfo=None) < cutoff_date:
-                        continue  # 1주일 이전 기사는 건너뛰기
-                except Exception as e:
-                    print(f"⚠️ 날짜 파싱 오류: {pub_date_str[:30]}... - {e}")
-                    continue
-
-            # Use Google redirect URL from <link> tag
-            # Google News RSS provides redirect URLs that work in browsers
-            # Note: <source url> only contains homepage URLs, not actual article URLs
-            # The redirect URL (news.google.com/rss/articles/...) redirects to the actual article when clicked
-            google_redirect_url = item.link.text if item.link else ''
-
-            # Validate and clean the URL
-            actual_url = validate_and_clean_url(google_redirect_url)
-
-            # Skip items with invalid URLs
-            if not actual_url:
-                print(f"⚠️ 유효하지 않은 URL 건너뛰기: {item.title.text if item.title else 'No title'}...")
-                continue
-
-            results.append({
-                'title': item.title.text if item.title else '',
-                'description': item.description.text if item.description else '',
-                'url': actual_url,
-                'pub_date': pub_date_str,
-                'type': 'News'
-            })
+        results = collect_recent_feed_items(
+            iter_xml_elements(fetch_feed(url), 'item'), num_results, days,
+            get_pub_date=lambda item: item.findtext('pubDate', ''),
+            parse_date=parsedate_to_datetime,  # RFC 2822 (예: "Wed, 27 Dec 2023 10:30:00 GMT")
+            extract=_extract_google_news_item,
+            skip_unparsable_date=True
+        )
 
         print(f"✅ {len(results)}개 뉴스 발견 (최근 {days}일 이내)")
         return results
@@ -516,30 +982,45 @@ def search_google_news(query, num_results=5, days=7):
         print(f"❌ Google News 검색 오류: {e}")
         return []
 
-# ==================== AI 아이템 선별 함수 ====================
+def collect_items_concurrently(query):
+    """모든 소스를 동시에 검색 (I/O 대기 시간을 겹쳐 전체 수집 시간 단축)
 
-def select_top_items_for_ran_engineers(all_items, top_n=10):
-    """Gemini를 사용하여 RAN SW 개발자에게 가장 유용한 아이템 선별"""
+    각 search_* 함수는 네트워크 I/O가 대부분이므로 스레드 풀에서 병렬 실행하면
+    전체 소요 시간이 소스별 지연 시간의 합이 아닌 최댓값에 가까워집니다.
 
-    api_key = os.environ.get('GEMINI_API_KEY')
+    Args:
+        query: 검색 키워드
 
-    if not api_key:
-        print("⚠️ GEMINI_API_KEY 없음. 상위 10개 아이템만 사용.")
-        return all_items[:top_n]
+    Returns:
+        tuple: (journals, papers_arxiv, news_google, news_verge)
+    """
+    # Note: Google Scholar removed due to bot detection (429 + CAPTCHA)
+    sources = [
+        (search_ieee, 10),          # IEEE Journals (10개)
+        (search_arxiv, 10),         # arXiv Papers (10개)
+        (search_google_news, 5),    # Google News (5개)
+        (search_the_verge, 5),      # The Verge (5개)
+    ]
 
-    # 아이템 정보 구성 (특수문자 완전 제거)
-    items_context = ""
-    for i, item in enumerate(all_items, 1):
-        # 특수문자 완전 제거 (백슬래시 이스케이프 대신)
-        title = item['title'].replace('"', '').replace("'", '').replace('\\', '').replace('\n', ' ').replace('\r', ' ').strip()[:150]
-        description = item['description'].replace('"', '').replace("'", '').replace('\\', '').replace('\n', ' ').replace('\r', ' ').strip()[:200]
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [executor.submit(func, query, num_results=n) for func, n in sources]
 
-        items_context += f"\n{i}. [{item['type']}] {title}\n"
-        items_context += f"   Description: {description}\n"
+        results = []
+        for (func, _), future in zip(sources, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # 개별 소스 실패는 전체 수집을 중단시키지 않음
+                print(f"❌ {func.__name__} 실행 오류: {e}")
+                results.append([])
+
+    return tuple(results)
 
-    prompt = f"""You are a RAN Network Professor and RAN SW Engineer expert.
+# ==================== AI 아이템 선별 함수 ====================
 
-Given {len(all_items)} items below (Journals, Papers, News), select exactly {top_n} items that would provide the MOST valuable insights for RAN SW developers.
+# 선별 프롬프트의 고정 부분 (페르소나/선별 기준/출력 형식)
+# - systemInstruction으로 분리해 매 호출 동일한 접두부가 되도록 함 (Gemini 암시적 캐싱 대상)
+SELECTION_SYSTEM_INSTRUCTION = """You are a RAN Network Professor and RAN SW Engineer expert.
 
 Selection criteria:
 - Practical applicability to RAN software development
@@ -550,9 +1031,6 @@ Selection criteria:
 - Real-world deployment experiences
 - Performance optimization techniques
 
-Items:
-{items_context}
-
 IMPORTANT: Return ONLY a valid JSON array of selected item numbers (1-indexed).
 - No markdown code blocks
 - No explanations
@@ -560,11 +1038,66 @@ IMPORTANT: Return ONLY a valid JSON array of selected item numbers (1-indexed).
 
 Example output format:
 [1, 5, 7, 12, 15, 18, 23, 28, 35, 40]
+"""
+
+# 선별 프롬프트용 특수문자 제거 테이블 (따옴표/백슬래시 삭제, 줄바꿈은 공백으로) - str.translate 한 번으로 처리
+_PROMPT_SANITIZE_TABLE = str.maketrans({'"': None, "'": None, '\\': None, '\n': ' ', '\r': ' '})
+
+_TITLE_NORMALIZE_RE = re.compile(r'\W+')
+
+def dedupe_by_title(items):
+    """정규화한 제목(소문자, 문자/숫자만, 앞 80자)이 같은 아이템은 첫 번째만 유지
+
+    Google News/arXiv/IEEE가 같은 기사·논문을 중복으로 반환하는 경우
+    선별 프롬프트 토큰과 중복 선별을 줄이기 위함.
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        key = _TITLE_NORMALIZE_RE.sub('', item['title'].lower())[:80]
+        if key and key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
+
+def select_top_items_for_ran_engineers(all_items, top_n=10):
+    """Gemini를 사용하여 RAN SW 개발자에게 가장 유용한 아이템 선별"""
+
+    # 제목 중복 제거 (선별/폴백 모두 중복 없는 목록 기준)
+    unique_items = dedupe_by_title(all_items)
+    if len(unique_items) < len(all_items):
+        print(f"🧹 제목 중복 {len(all_items) - len(unique_items)}개 제거")
+    all_items = unique_items
+
+    api_key = os.environ.get('GEMINI_API_KEY')
+
+    if not api_key:
+        print("⚠️ GEMINI_API_KEY 없음. 상위 10개 아이템만 사용.")
+        return all_items[:top_n]
+
+    # 아이템 정보 구성 (특수문자 완전 제거, 리스트에 모아 한 번에 join)
+    context_parts = []
+    for i, item in enumerate(all_items, 1):
+        # 특수문자 완전 제거 (백슬래시 이스케이프 대신)
+        title = item['title'].translate(_PROMPT_SANITIZE_TABLE).strip()[:150]
+        description = item['description'].translate(_PROMPT_SANITIZE_TABLE).strip()[:200]
+
+        context_parts.append(f"\n{i}. [{item['type']}] {title}\n   Description: {description}\n")
+    items_context = ''.join(context_parts)
+
+    prompt = f"""Given {len(all_items)} items below (Journals, Papers, News), select exactly {top_n} items that would provide the MOST valuable insights for RAN SW developers.
+
+Items:
+{items_context}
 """
 
     url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
 
     payload = {
+        "systemInstruction": {
+            "parts": [{"text": SELECTION_SYSTEM_INSTRUCTION}]
+        },
         "contents": [{
             "parts": [{"text": prompt}]
         }],
@@ -574,28 +1107,22 @@ Example output format:
         }
     }
 
+    # 같은 프롬프트(동일 아이템 구성)로 선별한 결과가 있으면 Gemini 호출 생략
+    # (프롬프트에 아이템 목록이 그대로 들어가므로 캐시된 인덱스가 같은 아이템을 가리킴)
+    cache_key = make_cache_key('select_top_items_for_ran_engineers', SELECTION_SYSTEM_INSTRUCTION, prompt)
+    cached_indices = cache_get(cache_key)
+    if cached_indices:
+        print(f"💾 캐시된 선별 결과 사용 ({len(cached_indices)}개)")
+        return [all_items[idx - 1] for idx in cached_indices]
+
     try:
         print(f"🤖 Gemini로 RAN SW 개발자용 Top {top_n} 아이템 선별 중...")
 
-        # Rate limit 방지 대기
-        import time
-        time.sleep(2)
-
-        response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
-
-        # 429 Rate Limit 및 500 Server Error 처리
-        if response.status_code == 429:
-            print("⚠️ Rate limit 도달. 10초 대기 후 재시도...")
-            time.sleep(10)
-            response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
-        elif response.status_code == 500:
-            print("⚠️ 서버 오류. 5초 대기 후 재시도...")
-            time.sleep(5)
-            response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
-
+        # Rate limit 간격 유지 + 429/5xx 및 연결 오류 재시도는 post_gemini에서 처리
+        response = post_gemini(url, payload, timeout=60)
         response.raise_for_status()
 
-        data = response.json()
+        data = json_loads(response.content)
 
         if 'candidates' in data and len(data['candidates']) > 0:
             candidate = data['candidates'][0]
@@ -608,15 +1135,14 @@ Example output format:
             if 'content' in candidate and 'parts' in candidate['content'] and len(candidate['content']['parts']) > 0:
                 text = candidate['content']['parts'][0].get('text', '').strip()
 
-                # JSON 추출 및 정제
+                # JSON 추출 (정제는 파싱 실패 시에만)
                 json_text = extract_json_from_text(text)
-                clean_text = clean_json_string(json_text)
 
                 # 응답 디버깅
-                print(f"📝 Gemini 응답 (처음 300자): {clean_text[:300]}")
+                print(f"📝 Gemini 응답 (처음 300자): {json_text[:300]}")
 
                 try:
-                    selected_indices = json.loads(clean_text)
+                    selected_indices = json_loads_with_cleanup(json_text)
 
                     # 배열인지 확인
                     if not isinstance(selected_indices, list):
@@ -625,21 +1151,24 @@ Example output format:
                         return all_items[:top_n]
 
                     # 선별된 아이템만 추출 (1-indexed를 0-indexed로 변환)
-                    selected_items = []
+                    valid_indices = []
                     for idx in selected_indices:
                         if isinstance(idx, int) and 1 <= idx <= len(all_items):
-                            selected_items.append(all_items[idx - 1])
+                            valid_indices.append(idx)
                         else:
                             print(f"⚠️ 잘못된 인덱스 무시: {idx}")
 
-                    if len(selected_items) >= top_n:
-                        print(f"✅ {len(selected_items)}개 아이템 선별 완료")
-                        return selected_items[:top_n]
+                    if len(valid_indices) >= top_n:
+                        valid_indices = valid_indices[:top_n]
+                        print(f"✅ {len(valid_indices)}개 아이템 선별 완료")
+                        cache_set(cache_key, valid_indices, GEMINI_PROMPT_CACHE_TTL)
+                        return [all_items[idx - 1] for idx in valid_indices]
                     else:
-                        print(f"⚠️ 선별된 아이템 부족 ({len(selected_items)}개). 상위 {top_n}개 사용.")
+                        print(f"⚠️ 선별된 아이템 부족 ({len(valid_indices)}개). 상위 {top_n}개 사용.")
                         return all_items[:top_n]
 
                 except json.JSONDecodeError as e:
+                    clean_text = clean_json_string(json_text)
                     print(f"❌ JSON 파싱 오류: {e}")
                     print(f"❌ 오류 위치: line {e.lineno}, column {e.colno}")
                     print(f"❌ 응답 전체:\n{clean_text[:500]}")
@@ -667,6 +1196,36 @@ Example output format:
 
 # ==================== AI 요약 함수 ====================
 
+# 한 번의 Gemini 호출로 요약할 최대 아이템 수 (초과 시 타입별 병렬 요약)
+SUMMARY_BATCH_MAX_ITEMS = 15
+
+# 포함 관계가 없을 때 제목 유사도로 매칭할 최소 비율 (difflib.SequenceMatcher ratio)
+TITLE_SIMILARITY_CUTOFF = 0.85
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_title(title):
+    """제목 비교용 정규화 키 (요약 제목은 대부분 원본 제목과 같으므로 캐시 재사용)
+
+    NFKC로 조합형/호환 문자(NFD 한글 자모, 전각 영숫자 등)를 통일하고 casefold로
+    대소문자를 없애서, 보이는 것은 같지만 코드포인트가 다른 제목도 완전 일치로 찾습니다.
+    """
+    return unicodedata.normalize('NFKC', title).casefold().strip()
+
+def _url_host(url):
+    """URL의 호스트 (소문자, 파싱 불가/빈 값은 '')"""
+    try:
+        return urlsplit(url or '').netloc.lower()
+    except ValueError:
+        return ''
+
+def _is_url_prefix(url, original_url):
+    """url이 original_url의 대표 URL(경로 ''/'/')이거나 앞부분인지 (파싱 불가면 False)"""
+    try:
+        path = urlsplit(url).path
+    except ValueError:
+        return False
+    return path in ('', '/') or original_url.startswith(url)
+
 def _preserve_original_urls(summaries, original_items):
     """
     Gemini 응답에서 URL이 잘못되었을 경우 원본 아이템의 URL을 복원
@@ -675,58 +1234,71 @@ def _preserve_original_urls(summaries, original_items):
         summaries: Gemini가 반환한 요약 결과 리스트
         original_items: 원본 아이템 리스트
     """
-    # 원본 아이템을 title로 매핑
+    # 원본 아이템을 정규화한 title로 매핑
+    # + 호스트별 URL (호스트에 원본 URL이 하나뿐일 때만 값, 여러 개면 None)
     original_map = {}
+    url_by_host = {}
     for item in original_items:
-        # title을 정규화 (공백, 특수문자 제거)
-        normalized_title = item['title'].lower().strip()
-        original_map[normalized_title] = item['url']
+        original_map[_normalize_title(item['title'])] = item['url']
+        host = _url_host(item['url'])
+        if host:
+            previous = url_by_host.get(host, item['url'])
+            url_by_host[host] = item['url'] if previous == item['url'] else None
 
     # 각 요약 아이템의 URL을 원본에서 복원
     for summary in summaries:
-        summary_title = summary.get('title', '').lower().strip()
+        summary_title = _normalize_title(summary.get('title', ''))
 
-        # 정확히 일치하는 title 찾기
-        if summary_title in original_map:
-            summary['url'] = original_map[summary_title]
+        # 정확히 일치하는 title 찾기 (조회 한 번으로 존재 확인 + 값 획득)
+        orig_url = original_map.get(summary_title)
+        if orig_url is not None:
+            summary['url'] = orig_url
             continue
 
         # 부분 일치 시도 (title이 일부만 포함된 경우)
-        for orig_title, orig_url in original_map.items():
-            # 양방향 부분 일치 확인
-            if (summary_title in orig_title or orig_title in summary_title) and len(summary_title) > 20:
-                summary['url'] = orig_url
-                break
-
-def summarize_with_gemini(items):
-    """Gemini AI로 6G 엔지니어 관점 요약"""
-    
-    api_key = os.environ.get('GEMINI_API_KEY')
-    
-    if not api_key:
-        print("⚠️ GEMINI_API_KEY 없음. AI 요약 생략.")
-        return create_summary_without_ai(items)
-    
-    # 아이템 정보 구성 (특수문자 완전 제거 - 이스케이프 문제 방지)
-    items_context = ""
-    for i, item in enumerate(items, 1):
-        # 특수문자 완전 제거 (JSON 파싱 오류 방지)
-        title = item['title'].replace('"', '').replace("'", '').replace('\\', '').replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()[:200]
-        description = item['description'].replace('"', '').replace("'", '').replace('\\', '').replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()[:300]
-        # URL 정제: 실제 줄바꿈 문자와 리터럴 \n 시퀀스 모두 제거
-        url = item['url'].replace('\n', '').replace('\r', '').replace('\t', '').replace(' ', '')
-        url = url.replace('\\n', '').replace('\\r', '').replace('\\t', '').strip()
-
-        items_context += f"\n{i}. [{item['type']}] {title}\n"
-        items_context += f"Description: {description}\n"
-        items_context += f"Link: {url}\n"
-    
-    prompt = f"""당신은 RAN Network Professor이자 RAN SW 개발 엔지니어입니다.
-
-다음 선별된 6G/RAN 관련 자료들을 RAN SW 개발자 관점에서 분석하고 요약해주세요.
-
-자료 목록:
-{items_context}
+        # 짧은 제목은 우연히 포함될 수 있으므로 20자 이하면 시도하지 않음 (루프 밖에서 한 번만 검사)
+        summary_len = len(summary_title)
+        best_url = None
+        if summary_len > 20:
+            # 첫 번째 일치가 아니라 길이 차이가 가장 작은 원본을 선택 (가장 강한 근거, 입력 순서에 덜 민감)
+            best_gap = None
+            for orig_title, orig_url in original_map.items():
+                # 양방향 부분 일치 확인: 짧은 쪽만 긴 쪽에 포함될 수 있으므로 길이로 방향을 정해 한 번만 검사
+                # (길이가 같으면 포함 = 완전 일치인데 위에서 이미 실패했으므로 건너뜀)
+                orig_len = len(orig_title)
+                if orig_len < summary_len:
+                    matched = orig_title in summary_title
+                elif orig_len > summary_len:
+                    matched = summary_title in orig_title
+                else:
+                    continue
+                if matched:
+                    gap = abs(orig_len - summary_len)
+                    if best_gap is None or gap < best_gap:  # 동률이면 먼저 나온 원본 유지
+                        best_url = orig_url
+                        best_gap = gap
+            if best_url is None:
+                # 따옴표 제거/부제 수정 등 약간 바뀐 제목: 유사도가 가장 높은 원본 (기준 미달이면 유지)
+                close = difflib.get_close_matches(summary_title, original_map, n=1, cutoff=TITLE_SIMILARITY_CUTOFF)
+                if close:
+                    best_url = original_map[close[0]]
+        if best_url is None:
+            # 제목 근거가 없을 때만: Gemini가 대표 URL(또는 원본 URL의 앞부분)만 반환했고
+            # 그 호스트에 원본이 하나뿐이면 그 URL 사용 (경로가 다른 URL은 다른 기사일 수 있으므로 유지)
+            returned_url = summary.get('url') or ''
+            host_url = url_by_host.get(_url_host(returned_url))
+            if host_url is not None and _is_url_prefix(returned_url, host_url):
+                best_url = host_url
+        if best_url is not None:
+            summary['url'] = best_url
+
+def _item_summary_cache_key(url):
+    """URL별 요약 캐시 키"""
+    return make_cache_key('item_summary', url)
+
+# 요약 프롬프트의 고정 부분 (페르소나/출력 형식/분석 관점)
+# - systemInstruction으로 분리해 매 호출 동일한 접두부가 되도록 함 (Gemini 암시적 캐싱 대상)
+SUMMARY_SYSTEM_INSTRUCTION = """당신은 RAN Network Professor이자 RAN SW 개발 엔지니어입니다.
 
 각 자료에 대해 다음 형식으로 요약하세요. 반드시 유효한 JSON 형식만 반환하고 다른 텍스트는 포함하지 마세요:
 
@@ -736,18 +1308,18 @@ IMPORTANT:
 - 문자열을 중간에 끊지 마세요
 - 유효한 JSON만 반환하세요
 
-{{
+{
   "summaries": [
-    {{
+    {
       "title": "논문 또는 저널 또는 뉴스 제목",
       "summary": "핵심 내용을 3-4문장으로 요약 (한국어). RAN 아키텍처, 알고리즘, 프로토콜 관점 포함.",
       "message": "RAN SW 개발자에게 주는 실무적 시사점과 적용 가능성 (한국어). 구체적인 SW 구현 관점 제시.",
       "url": "원문 링크",
       "type": "Journal 또는 Paper 또는 News"
-    }}
+    }
   ],
-  "generatedAt": "{datetime.now().strftime('%Y-%m-%d')}"
-}}
+  "generatedAt": "YYYY-MM-DD"
+}
 
 RAN SW 개발 관점에서 다음을 중점적으로 분석하세요:
 - RAN 프로토콜 스택 (MAC/RLC/PDCP/RRC) 영향
@@ -756,9 +1328,40 @@ RAN SW 개발 관점에서 다음을 중점적으로 분석하세요:
 - 실시간 성능 요구사항 및 최적화 기법
 - 실제 구현 시 고려사항"""
 
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
+def _summarize_batch(items, api_key):
+    """아이템 묶음을 한 번의 Gemini 호출로 요약
+
+    Args:
+        items: 요약할 아이템 리스트
+        api_key: Gemini API 키
+
+    Returns:
+        list: 요약 리스트 (URL은 원본으로 복원됨), 실패 시 None
+    """
+    # 아이템 정보 구성: 아이템당 JSON 한 줄 (json.dumps가 따옴표/백슬래시/제어문자를 한 번에 이스케이프)
+    items_context = "\n".join(
+        f"{i}. " + json.dumps({
+            'type': item['type'],
+            'title': ' '.join(item['title'].split())[:200],
+            'description': ' '.join(item['description'].split())[:300],
+            # URL 정제: 실제 공백/줄바꿈 문자와 리터럴 \n 시퀀스 모두 제거
+            'link': ''.join(item['url'].split()).replace('\\n', '').replace('\\r', '').replace('\\t', ''),
+        }, ensure_ascii=False)
+        for i, item in enumerate(items, 1)
+    )
+    
+    prompt = f"""다음 선별된 6G/RAN 관련 자료들을 RAN SW 개발자 관점에서 분석하고 요약해주세요.
+
+자료 목록:
+{items_context}"""
+
+    # 스트리밍 엔드포인트: 응답을 받는 동안 조각을 누적하고 JSON이 닫히면 바로 파싱
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:streamGenerateContent?alt=sse&key={api_key}"
 
     payload = {
+        "systemInstruction": {
+            "parts": [{"text": SUMMARY_SYSTEM_INSTRUCTION}]
+        },
         "contents": [{
             "parts": [{"text": prompt}]
         }],
@@ -767,339 +1370,318 @@ RAN SW 개발 관점에서 다음을 중점적으로 분석하세요:
             "topK": 40,
             "topP": 0.95,
             "maxOutputTokens": 16384,  # High limit for complex summarization (thinking + long output)
+            "responseMimeType": "application/json",  # 코드블록/설명문 없이 JSON만 반환
         }
     }
     
     try:
-        print("🤖 Gemini AI로 요약 중...")
-
-        # Rate limit 방지 대기
-        import time
-        time.sleep(2)
-
-        response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
-
-        # 429 Rate Limit 및 500 Server Error 처리
-        if response.status_code == 429:
-            print("⚠️ Rate limit 도달. 10초 대기 후 재시도...")
-            time.sleep(10)
-            response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
-        elif response.status_code == 500:
-            print("⚠️ 서버 오류. 5초 대기 후 재시도...")
-            time.sleep(5)
-            response = requests.post(url, json=payload, headers={'Content-Type': 'application/json'}, timeout=60)
+        print(f"🤖 Gemini AI로 요약 중... ({len(items)}개)")
 
+        response = post_gemini(url, payload, timeout=60, stream=True)
         response.raise_for_status()
         
-        data = response.json()
-        
-        if 'candidates' in data and len(data['candidates']) > 0:
-            candidate = data['candidates'][0]
-
-            # finishReason 확인
-            finish_reason = candidate.get('finishReason', 'UNKNOWN')
-            print(f"📝 finishReason: {finish_reason}")
-            if finish_reason == 'MAX_TOKENS':
-                print(f"⚠️ MAX_TOKENS에 도달. 응답이 불완전할 수 있습니다.")
-
-            if 'content' in candidate and 'parts' in candidate['content'] and len(candidate['content']['parts']) > 0:
-                text = candidate['content']['parts'][0].get('text', '')
-
-                # JSON 추출 및 정제
-                json_text = extract_json_from_text(text)
+        text, finish_reason = read_gemini_stream(response)
+
+        # finishReason 확인
+        print(f"📝 finishReason: {finish_reason}")
+        if finish_reason == 'MAX_TOKENS':
+            print(f"⚠️ MAX_TOKENS에 도달. 응답이 불완전할 수 있습니다.")
+
+        if text:
+            # JSON 추출 (정제는 파싱 실패 시에만)
+            json_text = extract_json_from_text(text)
+
+            # 파싱 전 디버깅
+            print(f"응답 텍스트 길이: {len(json_text)}")
+            print(f"응답 시작 (200자): {json_text[:200]}")
+
+            try:
+                results = json_loads_with_cleanup(json_text)
+
+                # 결과 검증 및 정규화
+                if isinstance(results, list):
+                    # 배열로 반환된 경우 (summaries만 반환)
+                    print(f"📝 배열 형식 응답 감지. 객체로 변환 중...")
+                    summaries = results
+                elif isinstance(results, dict):
+                    if 'summaries' not in results:
+                        print(f"⚠️ 'summaries' 키 없음. 응답 키: {list(results.keys())}")
+                        return None
+                    summaries = results['summaries']
+                else:
+                    print(f"⚠️ 잘못된 응답 타입: {type(results)}")
+                    return None
+
+                # URL 보존: 원본 아이템의 URL을 복원
+                _preserve_original_urls(summaries, items)
+                print(f"✅ {len(summaries)}개 요약 완료")
+
+                # URL별 요약 캐시 저장 (다음 실행에서 같은 기사는 Gemini 호출 생략)
+                # 원본 URL로 복원된 요약만 저장 (Gemini가 지어낸 링크는 캐시에 남기지 않음)
+                item_urls = {item['url'] for item in items}
+                for summary in summaries:
+                    if summary.get('url') in item_urls:
+                        cache_set(_item_summary_cache_key(summary['url']), summary, ITEM_SUMMARY_CACHE_TTL)
+                return summaries
+
+            except json.JSONDecodeError as e:
                 clean_text = clean_json_string(json_text)
-
-                # 파싱 전 디버깅
-                print(f"응답 텍스트 길이: {len(clean_text)}")
-                print(f"응답 시작 (200자): {clean_text[:200]}")
-
-                try:
-                    results = json.loads(clean_text)
-
-                    # 결과 검증 및 정규화
-                    if isinstance(results, list):
-                        # 배열로 반환된 경우 (summaries만 반환)
-                        print(f"📝 배열 형식 응답 감지. 객체로 변환 중...")
-                        normalized_results = {
-                            "summaries": results,
-                            "generatedAt": datetime.now().strftime('%Y-%m-%d')
-                        }
-                        # URL 보존: 원본 아이템의 URL을 복원
-                        _preserve_original_urls(normalized_results['summaries'], items)
-                        print(f"✅ {len(normalized_results['summaries'])}개 요약 완료")
-                        return normalized_results
-                    elif isinstance(results, dict):
-                        if 'summaries' not in results:
-                            print(f"⚠️ 'summaries' 키 없음. 응답 키: {list(results.keys())}")
-                            return create_summary_without_ai(items)
-                        # URL 보존: 원본 아이템의 URL을 복원
-                        _preserve_original_urls(results['summaries'], items)
-                        print(f"✅ {len(results['summaries'])}개 요약 완료")
-                        return results
-                    else:
-                        print(f"⚠️ 잘못된 응답 타입: {type(results)}")
-                        return create_summary_without_ai(items)
-
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON 파싱 오류: {e}")
-                    print(f"오류 위치: line {e.lineno}, column {e.colno}")
-
-                    # 문제 영역 출력 (오류 위치 전후 200자)
-                    error_pos = e.pos if hasattr(e, 'pos') else 0
-                    start_pos = max(0, error_pos - 200)
-                    end_pos = min(len(clean_text), error_pos + 200)
-                    print(f"문제 영역:\n{clean_text[start_pos:end_pos]}")
-                    print(f"\n전체 응답 저장 중...")
-
-                    # 디버깅을 위해 전체 응답을 파일로 저장
-                    debug_file = f"debug_gemini_response_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(f"원본:\n{text}\n\n")
-                        f.write(f"JSON 추출:\n{json_text}\n\n")
-                        f.write(f"정제 후:\n{clean_text}\n")
-                    print(f"전체 응답이 {debug_file}에 저장되었습니다.")
-
-                    return create_summary_without_ai(items)
+                print(f"❌ JSON 파싱 오류: {e}")
+                print(f"오류 위치: line {e.lineno}, column {e.colno}")
+
+                # 문제 영역 출력 (오류 위치 전후 200자)
+                error_pos = e.pos if hasattr(e, 'pos') else 0
+                start_pos = max(0, error_pos - 200)
+                end_pos = min(len(clean_text), error_pos + 200)
+                print(f"문제 영역:\n{clean_text[start_pos:end_pos]}")
+                print(f"\n전체 응답 저장 중...")
+
+                # 디버깅을 위해 전체 응답을 파일로 저장
+                debug_file = f"debug_gemini_response_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.txt"
+                with open(debug_file, 'w', encoding='utf-8') as f:
+                    f.write(f"원본:\n{text}\n\n")
+                    f.write(f"JSON 추출:\n{json_text}\n\n")
+                    f.write(f"정제 후:\n{clean_text}\n")
+                print(f"전체 응답이 {debug_file}에 저장되었습니다.")
+
+                return None
         
-        print("⚠️ AI 요약 실패. 기본 요약 사용.")
-        return create_summary_without_ai(items)
+        print("⚠️ AI 요약 응답 없음.")
+        return None
         
     except requests.exceptions.RequestException as e:
         print(f"❌ Gemini API 오류: {e}")
-        return create_summary_without_ai(items)
+        return None
     except Exception as e:
         print(f"❌ Gemini API 오류: {e}")
-        return create_summary_without_ai(items)
+        return None
 
-def create_summary_without_ai(items):
-    """AI 없이 기본 요약 생성"""
-    
-    results = {
-        "summaries": [],
-        "generatedAt": datetime.now().strftime('%Y-%m-%d')
-    }
+def _drop_unknown_urls(summaries, items):
+    """원본 아이템에 없는 URL의 요약 제거 (제목 매칭에 실패해 Gemini가 지어낸 링크가 남은 경우)"""
+    known_urls = {item['url'] for item in items}
+    kept = [summary for summary in summaries if summary.get('url') in known_urls]
+    if len(kept) < len(summaries):
+        print(f"⚠️ 원본에 없는 URL의 요약 {len(summaries) - len(kept)}개 제외")
+    return kept
+
+def _summarize_batch_filling_gaps(items, api_key):
+    """배치 요약 후, 응답에서 빠진 아이템만 한 번 더 배치 요약
+
+    Args:
+        items: 요약할 아이템 리스트
+        api_key: Gemini API 키
+
+    Returns:
+        tuple: (요약 리스트 또는 None(배치 실패), 모든 아이템이 AI 요약되었는지 여부)
+    """
+    summaries = _summarize_batch(items, api_key)
+    if summaries is None:
+        return None, False
+
+    # URL은 _preserve_original_urls로 원본 값이 복원되어 있으므로 URL로 누락 판별
+    # (복원되지 못한 요약은 버리고 해당 아이템을 누락으로 재요약해 중복/잘못된 링크 방지)
+    summaries = _drop_unknown_urls(summaries, items)
+    summarized_urls = {summary.get('url') for summary in summaries}
+    missing = [item for item in items if item['url'] not in summarized_urls]
+    if not missing:
+        return summaries, True
+
+    print(f"🔁 응답에서 누락된 {len(missing)}개 아이템만 다시 요약")
+    retried = _summarize_batch(missing, api_key)
+    if retried is None:
+        print(f"⚠️ 누락 아이템 재요약 실패. 기본 요약 사용.")
+        return summaries + create_summary_without_ai(missing)['summaries'], False
+    retried = _drop_unknown_urls(retried, missing)
+    retried_urls = {summary['url'] for summary in retried}
+    still_missing = [item for item in missing if item['url'] not in retried_urls]
+    if still_missing:
+        print(f"⚠️ 재요약 후에도 누락된 {len(still_missing)}개 아이템은 기본 요약 사용.")
+        return summaries + retried + create_summary_without_ai(still_missing)['summaries'], False
+    return summaries + retried, True
+
+def _attach_groups(results):
+    """요약 결과에 타입별 그룹('groups')을 붙여 반환 (이메일/텔레그램/파일 저장이 재사용)"""
+    results['groups'] = group_by_type(results['summaries'])
+    return results
+
+def summarize_with_gemini(items):
+    """Gemini AI로 6G 엔지니어 관점 요약
+
+    Returns:
+        dict: {"summaries", "generatedAt", "groups"} - groups는 group_by_type 결과
+    """
     
+    api_key = os.environ.get('GEMINI_API_KEY')
+    
+    if not api_key:
+        print("⚠️ GEMINI_API_KEY 없음. AI 요약 생략.")
+        return _attach_groups(create_summary_without_ai(items))
+
+    # 동일한 아이템 구성에 대한 요약 캐시 확인 (재실행 시 Gemini 호출 생략)
+    cache_key = make_cache_key('summarize_with_gemini', [[item['title'], item['url'], item['type']] for item in items])
+    cached = cache_get(cache_key)
+    if cached is not None:
+        print(f"💾 캐시된 요약 사용 ({len(cached['summaries'])}개)")
+        cached['generatedAt'] = datetime.now().strftime('%Y-%m-%d')
+        return _attach_groups(cached)
+
+    item_urls = {item['url'] for item in items}
+
+    # 이전 실행에서 이미 요약된 URL은 캐시 사용, 나머지만 Gemini로 요약
+    cached_summaries = []
+    pending = []
     for item in items:
-        results["summaries"].append({
-            "title": item['title'],
-            "summary": item['description'][:300] if item.get('description') else "내용을 확인하세요.",
-            "message": f"6G 기술 발전의 최신 동향을 보여주는 {item['type']} 자료입니다.",
-            "url": item['url'],
-            "type": item['type']
-        })
+        item_cached = cache_get(_item_summary_cache_key(item['url']))
+        if item_cached is not None:
+            item_cached['type'] = item['type']
+            cached_summaries.append(item_cached)
+        else:
+            pending.append(item)
+    if cached_summaries:
+        print(f"💾 URL 캐시 요약 {len(cached_summaries)}개 사용, {len(pending)}개 새로 요약")
+    items = pending
+
+    summaries = None
+    fully_summarized = True
+    if not items:
+        summaries = []
+    elif len(items) <= SUMMARY_BATCH_MAX_ITEMS:
+        # 1차: 전체 아이템을 한 번에 요약 (Gemini 호출 1회, 누락분만 추가 호출)
+        summaries, fully_summarized = _summarize_batch_filling_gaps(items, api_key)
+
+    if summaries is None:
+        # 2차: 타입별(Journal/Paper/News)로 나눠 병렬 요약
+        # - 왕복 시간이 합이 아닌 최댓값으로 겹치고, 일부 실패 시 해당 타입만 기본 요약 사용
+        groups = {}
+        for item in items:
+            groups.setdefault(item['type'], []).append(item)
+
+        print(f"🔀 타입별 병렬 요약으로 전환 ({', '.join(groups)})")
+        with ThreadPoolExecutor(max_workers=len(groups) or 1) as executor:
+            futures = [executor.submit(_summarize_batch_filling_gaps, group, api_key) for group in groups.values()]
+            group_summaries = [future.result() for future in futures]
+
+        fully_summarized = all(complete for _, complete in group_summaries)
+        summaries = []
+        for group, (group_result, _) in zip(groups.values(), group_summaries):
+            if group_result is None:
+                print(f"⚠️ {group[0]['type']} 요약 실패. 기본 요약 사용.")
+                group_result = create_summary_without_ai(group)['summaries']
+            summaries.extend(group_result)
+
+    results = {
+        "summaries": cached_summaries + summaries,
+        "generatedAt": datetime.now().strftime('%Y-%m-%d')
+    }
+    # 기본 요약이 섞였거나 원본에 없는 URL이 있는 결과는 캐시하지 않음 (다음 실행에서 재시도)
+    if fully_summarized and all(summary.get('url') in item_urls for summary in results['summaries']):
+        cache_set(cache_key, results, SUMMARY_CACHE_TTL)  # groups는 붙이기 전에 저장 (중복 저장 방지)
+    return _attach_groups(results)
+
+def create_summary_without_ai(items):
+    """AI 없이 기본 요약 생성"""
     
-    return results
+    return {
+        "summaries": [
+            {
+                "title": item['title'],
+                "summary": (item.get('description') or '')[:300] or "내용을 확인하세요.",
+                "message": f"6G 기술 발전의 최신 동향을 보여주는 {item['type']} 자료입니다.",
+                "url": item['url'],
+                "type": item['type']
+            }
+            for item in items
+        ],
+        "generatedAt": datetime.now().strftime('%Y-%m-%d')
+    }
 
 # ==================== 이메일 전송 ====================
 
-def create_html_email(summary_data):
-    """HTML 이메일 생성 (Engineer 포맷)"""
-    
-    html = f"""
+# 아이템 타입 표시 순서 (TYPE_ORDER에 없는 타입은 News로 취급)
+TYPE_ORDER = {'Journal': 0, 'Paper': 1, 'News': 2}
+
+def group_by_type(summaries):
+    """요약 리스트를 타입별로 묶기 (리스트를 한 번만 순회, 타입 내 원래 순서 유지)
+
+    개수가 필요하면 별도 순회 없이 len(groups[타입])을 사용합니다.
+
+    Args:
+        summaries: 요약 아이템 리스트
+
+    Returns:
+        dict: {타입: [아이템, ...]} - Journal → Paper → News 순서, 빈 타입도 포함
+    """
+    groups = {item_type: [] for item_type in TYPE_ORDER}
+    # 타입별 list.append를 미리 바인딩 (아이템마다 dict 조회 1번 + 호출, 알 수 없는 타입은 News)
+    appenders = {item_type: bucket.append for item_type, bucket in groups.items()}
+    append_news = appenders['News']
+    for item in summaries:
+        appenders.get(item.get('type'), append_news)(item)
+    return groups
+
+def get_groups(summary_data):
+    """summary_data의 타입별 그룹 (summarize_with_gemini가 만든 'groups'가 있으면 재사용)"""
+    groups = summary_data.get('groups')
+    if groups is None:
+        groups = group_by_type(summary_data['summaries'])
+    return groups
+
+# create_html_email 섹션별 (제목, 배지, 링크 문구)
+HTML_EMAIL_SECTIONS = {
+    'Journal': ('📚 Academic Journals', 'JOURNAL', 'Read Full Article'),
+    'Paper': ('📄 Research Papers', 'PAPER', 'Read Full Paper'),
+    'News': ('📰 Industry News', 'NEWS', 'Read Full News')
+}
+
+# create_html_email 문서 시작 ~ <style> 직전
+_HTML_EMAIL_HEAD_START = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <style>
-            body {{
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 900px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }}
-            .container {{
-                background-color: white;
-                border-radius: 10px;
-                padding: 30px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }}
-            .header {{
-                background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
-                color: white;
-                padding: 30px;
-                border-radius: 10px;
-                margin-bottom: 30px;
-                text-align: center;
-            }}
-            .header h1 {{
-                margin: 0;
-                font-size: 28px;
-            }}
-            .header .subtitle {{
-                color: #e0e0e0;
-                font-size: 14px;
-                margin-top: 10px;
-            }}
-            .section {{
-                margin-bottom: 40px;
-            }}
-            .section-title {{
-                color: #1e3a8a;
-                font-size: 20px;
-                font-weight: bold;
-                margin-bottom: 20px;
-                padding-bottom: 10px;
-                border-bottom: 3px solid #3b82f6;
-            }}
-            .item {{
-                background-color: #f9fafb;
-                border-left: 4px solid #3b82f6;
-                padding: 20px;
-                margin-bottom: 20px;
-                border-radius: 5px;
-            }}
-            .item-type {{
-                display: inline-block;
-                background: #3b82f6;
-                color: white;
-                padding: 4px 12px;
-                border-radius: 12px;
-                font-size: 12px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            .item-title {{
-                color: #1e3a8a;
-                font-size: 18px;
-                font-weight: bold;
-                margin-bottom: 15px;
-            }}
-            .item-title a {{
-                color: #1e3a8a;
-                text-decoration: none;
-            }}
-            .item-title a:hover {{
-                text-decoration: underline;
-            }}
-            .summary {{
-                color: #4b5563;
-                margin-bottom: 15px;
-                line-height: 1.8;
-            }}
-            .message {{
-                background-color: #eff6ff;
-                border-left: 3px solid #2563eb;
-                padding: 15px;
-                margin-top: 15px;
-                border-radius: 3px;
-            }}
-            .message-label {{
-                color: #1e40af;
-                font-weight: bold;
-                font-size: 14px;
-                margin-bottom: 8px;
-            }}
-            .message-text {{
-                color: #1e40af;
-                font-size: 14px;
-            }}
-            .source {{
-                margin-top: 15px;
-                padding-top: 15px;
-                border-top: 1px solid #e5e7eb;
-            }}
-            .source a {{
-                color: #2563eb;
-                text-decoration: none;
-                font-size: 14px;
-            }}
-            .source a:hover {{
-                text-decoration: underline;
-            }}
-            .footer {{
-                text-align: center;
-                margin-top: 40px;
-                padding-top: 20px;
-                border-top: 1px solid #e0e0e0;
-                color: #999;
-                font-size: 12px;
-            }}
-        </style>
+"""
+
+# create_html_email </style> ~ 헤더 날짜 앞까지
+_HTML_EMAIL_HEAD_AFTER_CSS = """        </style>
     </head>
     <body>
         <div class="container">
             <div class="header">
                 <h1>🔬 6G Technology Intelligence Report</h1>
-                <div class="subtitle">Engineer's Perspective | {summary_data['generatedAt']}</div>
+                <div class="subtitle">Engineer's Perspective | """
+
+@functools.lru_cache(maxsize=1)
+def _html_email_head():
+    """create_html_email 문서 시작 ~ 헤더 날짜 앞까지 (스크립트 옆 email.css를 첫 호출 시 한 번만 읽음)"""
+    css = Path(__file__).with_name('email.css').read_text(encoding='utf-8')
+    return _HTML_EMAIL_HEAD_START + css + _HTML_EMAIL_HEAD_AFTER_CSS
+
+# 헤더 날짜 뒤 ~ 헤더 끝
+_HTML_EMAIL_HEAD_END = """</div>
             </div>
     """
-    
-    # Journal, Paper, News별로 그룹핑
-    groups = {'Journal': [], 'Paper': [], 'News': []}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        groups[item_type].append(item)
-    
-    # Journal 섹션
-    if groups['Journal']:
-        html += '<div class="section"><div class="section-title">📚 Academic Journals</div>'
-        for item in groups['Journal']:
-            html += f"""
-            <div class="item">
-                <span class="item-type">JOURNAL</span>
-                <div class="item-title">
-                    <a href="{item['url']}" target="_blank">{item['title']}</a>
-                </div>
-                <div class="summary">{item['summary']}</div>
-                <div class="message">
-                    <div class="message-label">💡 Engineer's Insight</div>
-                    <div class="message-text">{item['message']}</div>
-                </div>
-                <div class="source">
-                    🔗 <a href="{item['url']}" target="_blank">Read Full Article</a>
-                </div>
-            </div>
-            """
-        html += '</div>'
-    
-    # Paper 섹션
-    if groups['Paper']:
-        html += '<div class="section"><div class="section-title">📄 Research Papers</div>'
-        for item in groups['Paper']:
-            html += f"""
-            <div class="item">
-                <span class="item-type">PAPER</span>
-                <div class="item-title">
-                    <a href="{item['url']}" target="_blank">{item['title']}</a>
-                </div>
-                <div class="summary">{item['summary']}</div>
-                <div class="message">
-                    <div class="message-label">💡 Engineer's Insight</div>
-                    <div class="message-text">{item['message']}</div>
-                </div>
-                <div class="source">
-                    🔗 <a href="{item['url']}" target="_blank">Read Full Paper</a>
-                </div>
-            </div>
-            """
-        html += '</div>'
-    
-    # News 섹션
-    if groups['News']:
-        html += '<div class="section"><div class="section-title">📰 Industry News</div>'
-        for item in groups['News']:
-            html += f"""
+
+# create_html_email 아이템 1개
+_HTML_EMAIL_ITEM_TEMPLATE = """
             <div class="item">
-                <span class="item-type">NEWS</span>
+                <span class="item-type">{badge}</span>
                 <div class="item-title">
-                    <a href="{item['url']}" target="_blank">{item['title']}</a>
+                    <a href="{url}" target="_blank">{title}</a>
                 </div>
-                <div class="summary">{item['summary']}</div>
+                <div class="summary">{summary}</div>
                 <div class="message">
                     <div class="message-label">💡 Engineer's Insight</div>
-                    <div class="message-text">{item['message']}</div>
+                    <div class="message-text">{message}</div>
                 </div>
                 <div class="source">
-                    🔗 <a href="{item['url']}" target="_blank">Read Full News</a>
+                    🔗 <a href="{url}" target="_blank">{link_text}</a>
                 </div>
             </div>
             """
-        html += '</div>'
-    
-    html += """
+
+# create_html_email 푸터 ~ 문서 끝
+_HTML_EMAIL_FOOTER = """
             <div class="footer">
                 <p>🤖 Automated by GitHub Actions | Powered by Google Gemini AI</p>
                 <p>6G Technology Intelligence System for Engineers</p>
@@ -1108,485 +1690,90 @@ def create_html_email(summary_data):
     </body>
     </html>
     """
-    
-    return html
 
-#!/usr/bin/env python3
-"""
-시각적으로 개선된 이메일 템플릿
-- 카드 스타일 디자인
-- 컬러 코딩 (Journal: 파랑, Paper: 초록, News: 주황)
-- 아이콘 활용
-- 읽기 쉬운 레이아웃
-"""
-def create_visual_html_email(summary_data):
-    """시각적으로 개선된 HTML 이메일 생성"""
-    
-    # 타입별 색상 및 아이콘 정의
-    type_config = {
-        'Journal': {
-            'color': '#3b82f6',
-            'bg_color': '#eff6ff',
-            'icon': '📚',
-            'label': 'Academic Journal'
-        },
-        'Paper': {
-            'color': '#10b981',
-            'bg_color': '#f0fdf4',
-            'icon': '📄',
-            'label': 'Research Paper'
-        },
-        'News': {
-            'color': '#f59e0b',
-            'bg_color': '#fffbeb',
-            'icon': '📰',
-            'label': 'Industry News'
-        }
-    }
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {{
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }}
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                line-height: 1.6;
-                color: #1f2937;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 20px;
-            }}
-            .email-container {{
-                max-width: 800px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 16px;
-                overflow: hidden;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            }}
-            
-            /* 헤더 */
-            .header {{
-                background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
-                color: white;
-                padding: 40px 30px;
-                text-align: center;
-                position: relative;
-                overflow: hidden;
-            }}
-            .header::before {{
-                content: '';
-                position: absolute;
-                top: -50%;
-                right: -10%;
-                width: 200px;
-                height: 200px;
-                background: rgba(255,255,255,0.1);
-                border-radius: 50%;
-            }}
-            .header::after {{
-                content: '';
-                position: absolute;
-                bottom: -30%;
-                left: -5%;
-                width: 150px;
-                height: 150px;
-                background: rgba(255,255,255,0.08);
-                border-radius: 50%;
-            }}
-            .header-content {{
-                position: relative;
-                z-index: 1;
-            }}
-            .header h1 {{
-                font-size: 32px;
-                font-weight: 700;
-                margin-bottom: 8px;
-                text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }}
-            .header-subtitle {{
-                font-size: 16px;
-                opacity: 0.9;
-                font-weight: 300;
-            }}
-            .header-date {{
-                display: inline-block;
-                background: rgba(255,255,255,0.2);
-                padding: 8px 20px;
-                border-radius: 20px;
-                margin-top: 16px;
-                font-size: 14px;
-                backdrop-filter: blur(10px);
-            }}
-            
-            /* 통계 요약 */
-            .stats {{
-                display: flex;
-                justify-content: space-around;
-                padding: 30px;
-                background: linear-gradient(to bottom, #f9fafb, white);
-                border-bottom: 1px solid #e5e7eb;
-            }}
-            .stat-item {{
-                text-align: center;
-                padding: 0 20px;
-            }}
-            .stat-number {{
-                font-size: 36px;
-                font-weight: 700;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }}
-            .stat-label {{
-                font-size: 13px;
-                color: #6b7280;
-                margin-top: 4px;
-                font-weight: 500;
-            }}
-            
-            /* 컨텐츠 영역 */
-            .content {{
-                padding: 30px;
-                background-color: #f9fafb;
-            }}
-            
-            /* 섹션 헤더 */
-            .section-header {{
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                margin: 40px 0 24px 0;
-                padding-bottom: 12px;
-                border-bottom: 3px solid #e5e7eb;
-            }}
-            .section-header:first-child {{
-                margin-top: 0;
-            }}
-            .section-icon {{
-                font-size: 28px;
-            }}
-            .section-title {{
-                font-size: 22px;
-                font-weight: 700;
-                color: #1f2937;
-            }}
-            .section-count {{
-                margin-left: auto;
-                background: #f3f4f6;
-                color: #6b7280;
-                padding: 4px 12px;
-                border-radius: 12px;
-                font-size: 13px;
-                font-weight: 600;
-            }}
-            
-            /* 카드 스타일 */
-            .card {{
-                background: white;
-                border-radius: 12px;
-                padding: 24px;
-                margin-bottom: 20px;
-                border: 2px solid #e5e7eb;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                transition: all 0.3s ease;
-                position: relative;
-                overflow: hidden;
-            }}
-            .card::before {{
-                content: '';
-                position: absolute;
-                left: 0;
-                top: 0;
-                bottom: 0;
-                width: 5px;
-                background: var(--card-color);
-            }}
-            .card:hover {{
-                box-shadow: 0 12px 24px rgba(0,0,0,0.15);
-                transform: translateY(-4px);
-                border-color: var(--card-color);
-            }}
-            
-            /* 타입 배지 */
-            .type-badge {{
-                display: inline-flex;
-                align-items: center;
-                gap: 6px;
-                padding: 6px 14px;
-                border-radius: 20px;
-                font-size: 12px;
-                font-weight: 600;
-                margin-bottom: 12px;
-                background: var(--badge-bg);
-                color: var(--badge-color);
-            }}
-            
-            /* 카드 제목 */
-            .card-title {{
-                font-size: 20px;
-                font-weight: 700;
-                color: #1f2937;
-                margin-bottom: 16px;
-                line-height: 1.4;
-            }}
-            .card-title a {{
-                color: inherit;
-                text-decoration: none;
-                transition: color 0.2s;
-            }}
-            .card-title a:hover {{
-                color: var(--card-color);
-            }}
-            
-            /* 카드 내용 */
-            .card-summary {{
-                color: #4b5563;
-                font-size: 15px;
-                line-height: 1.7;
-                margin-bottom: 16px;
-                padding: 16px;
-                background: #f9fafb;
-                border-radius: 8px;
-                border-left: 3px solid var(--card-color);
-            }}
-            
-            /* 인사이트 박스 */
-            .insight-box {{
-                background: var(--badge-bg);
-                border-radius: 8px;
-                padding: 16px;
-                margin-top: 16px;
-                border-left: 3px solid var(--card-color);
-            }}
-            .insight-label {{
-                display: flex;
-                align-items: center;
-                gap: 6px;
-                font-weight: 700;
-                color: var(--card-color);
-                font-size: 14px;
-                margin-bottom: 8px;
-            }}
-            .insight-text {{
-                color: #374151;
-                font-size: 14px;
-                line-height: 1.6;
-            }}
-            
-            /* 링크 버튼 */
-            .card-link {{
-                display: inline-flex;
-                align-items: center;
-                gap: 6px;
-                margin-top: 16px;
-                padding: 10px 20px;
-                background: var(--card-color);
-                color: white;
-                text-decoration: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                transition: all 0.2s;
-            }}
-            .card-link:hover {{
-                transform: translateX(4px);
-                box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            }}
-            
-            /* 푸터 */
-            .footer {{
-                background: #f9fafb;
-                padding: 30px;
-                text-align: center;
-                border-top: 1px solid #e5e7eb;
-            }}
-            .footer-text {{
-                color: #6b7280;
-                font-size: 13px;
-                margin-bottom: 8px;
-            }}
-            .footer-logo {{
-                font-size: 24px;
-                margin-top: 12px;
-            }}
-            
-            /* 반응형 */
-            @media (max-width: 600px) {{
-                .header h1 {{
-                    font-size: 24px;
-                }}
-                .stats {{
-                    flex-direction: column;
-                    gap: 20px;
-                }}
-                .stat-item {{
-                    padding: 0;
-                }}
-                .content {{
-                    padding: 20px;
-                }}
-                .card {{
-                    padding: 16px;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="email-container">
-            <!-- 헤더 -->
-            <div class="header">
-                <div class="header-content">
-                    <h1>🔬 6G Technology Intelligence</h1>
-                    <div class="header-subtitle">Professional Research Report for Engineers</div>
-                    <div class="header-date">📅 {summary_data['generatedAt']}</div>
-                </div>
-            </div>
-            
-            <!-- 통계 요약 -->
-            <div class="stats">
-    """
-    
-    # 타입별 개수 계산
-    type_counts = {'Journal': 0, 'Paper': 0, 'News': 0}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        type_counts[item_type] = type_counts.get(item_type, 0) + 1
-    
-    html += f"""
-                <div class="stat-item">
-                    <div class="stat-number">{type_counts.get('Journal', 0)}</div>
-                    <div class="stat-label">📚 Journals</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{type_counts.get('Paper', 0)}</div>
-                    <div class="stat-label">📄 Papers</div>
-                </div>
-                <div class="stat-item">
-                    <div class="stat-number">{type_counts.get('News', 0)}</div>
-                    <div class="stat-label">📰 News</div>
-                </div>
-            </div>
-            
-            <!-- 컨텐츠 -->
-            <div class="content">
+def create_html_email(summary_data):
+    """HTML 이메일 생성 (Engineer 포맷)
+
+    모듈 레벨 템플릿(_HTML_EMAIL_*)에 값을 채워 넣으며, 제목/요약/인사이트/URL은
+    이스케이프하여 '<', '&' 등이 마크업을 깨뜨리지 않도록 합니다.
     """
+    escape = html.escape
+
+    # 정적 head/CSS는 상수 그대로, 날짜만 끼워 넣음 (5KB 템플릿을 매번 format하지 않음)
+    html_parts = [_html_email_head(), escape(summary_data['generatedAt']), _HTML_EMAIL_HEAD_END]
+    append = html_parts.append  # 루프 내 속성 조회 생략
     
-    # 타입별로 그룹핑
-    groups = {'Journal': [], 'Paper': [], 'News': []}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        groups[item_type].append(item)
-    
-    # 각 섹션 렌더링
-    section_titles = {
-        'Journal': '📚 Academic Journals',
-        'Paper': '📄 Research Papers',
-        'News': '📰 Industry News'
-    }
-    
-    for section_type, items in groups.items():
+    # Journal → Paper → News 순서로 한 번에 렌더링
+    for section_type, items in get_groups(summary_data).items():
         if not items:
             continue
-            
-        config = type_config[section_type]
-        
-        html += f"""
-                <div class="section-header">
-                    <span class="section-icon">{config['icon']}</span>
-                    <span class="section-title">{section_titles[section_type]}</span>
-                    <span class="section-count">{len(items)} items</span>
-                </div>
-        """
-        
+        section_title, badge, link_text = HTML_EMAIL_SECTIONS[section_type]
+        append(f'<div class="section"><div class="section-title">{section_title}</div>')
         for item in items:
-            html += f"""
-                <div class="card" style="--card-color: {config['color']}; --badge-bg: {config['bg_color']}; --badge-color: {config['color']};">
-                    <div class="type-badge">
-                        <span>{config['icon']}</span>
-                        <span>{config['label']}</span>
-                    </div>
-                    
-                    <div class="card-title">
-                        <a href="{item['url']}" target="_blank">{item['title']}</a>
-                    </div>
-                    
-                    <div class="card-summary">
-                        {item['summary']}
-                    </div>
-                    
-                    <div class="insight-box">
-                        <div class="insight-label">
-                            <span>💡</span>
-                            <span>Engineer's Insight</span>
-                        </div>
-                        <div class="insight-text">
-                            {item['message']}
-                        </div>
-                    </div>
-                    
-                    <a href="{item['url']}" class="card-link" target="_blank">
-                        <span>Read Full Article</span>
-                        <span>→</span>
-                    </a>
-                </div>
-            """
+            append(_HTML_EMAIL_ITEM_TEMPLATE.format(
+                badge=badge,
+                url=escape(item['url']),
+                title=escape(item['title']),
+                summary=escape(item['summary']),
+                message=escape(item['message']),
+                link_text=link_text
+            ))
+        append('</div>')
     
-    html += """
-            </div>
-            
-            <!-- 푸터 -->
-            <div class="footer">
-                <div class="footer-text">🤖 Automated by GitHub Actions</div>
-                <div class="footer-text">Powered by Google Gemini AI</div>
-                <div class="footer-logo">🔬 6G Intelligence System</div>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    append(_HTML_EMAIL_FOOTER)
     
-    return html
+    return ''.join(html_parts)
 
 """
 이메일 클라이언트 호환성이 높은 HTML 템플릿
 CSS 변수 없이 인라인 스타일 사용
 """
 
-def create_email_safe_html(summary_data, hot_keyword=None):
-    """이메일 클라이언트 호환 HTML 생성"""
-    
-    # 타입별 색상 정의
-    colors = {
-        'Journal': {
-            'primary': '#3b82f6',
-            'bg': '#eff6ff',
-            'icon': '📚',
-            'label': 'Academic Journal'
-        },
-        'Paper': {
-            'primary': '#10b981',
-            'bg': '#f0fdf4',
-            'icon': '📄',
-            'label': 'Research Paper'
-        },
-        'News': {
-            'primary': '#f59e0b',
-            'bg': '#fffbeb',
-            'icon': '📰',
-            'label': 'Industry News'
-        }
+# 타입별 색상 정의
+SAFE_EMAIL_COLORS = {
+    'Journal': {
+        'primary': '#3b82f6',
+        'bg': '#eff6ff',
+        'icon': '📚',
+        'label': 'Academic Journal'
+    },
+    'Paper': {
+        'primary': '#10b981',
+        'bg': '#f0fdf4',
+        'icon': '📄',
+        'label': 'Research Paper'
+    },
+    'News': {
+        'primary': '#f59e0b',
+        'bg': '#fffbeb',
+        'icon': '📰',
+        'label': 'Industry News'
     }
-    
-    html = f"""
+}
+
+# 섹션 제목
+SAFE_EMAIL_SECTION_TITLES = {
+    'Journal': '📚 Academic Journals',
+    'Paper': '📄 Research Papers',
+    'News': '📰 Industry News'
+}
+
+# HTML 조각 템플릿 (모듈 로드 시 한 번만 생성, str.format 자리표시자 사용)
+# 자리표시자에 들어가는 외부 텍스트(제목/요약/URL 등)는 렌더링 시 html.escape로 이스케이프
+
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_HTML_INDENT_RE = re.compile(r'\n\s+')
+
+def _compact_html(markup):
+    """템플릿의 HTML 주석과 줄 앞 들여쓰기를 제거 (전송 바이트 축소)
+
+    인라인 스타일은 이메일 클라이언트 호환을 위해 그대로 두고, 공백은 줄바꿈 하나로
+    남기므로 렌더링 결과는 같습니다.
+    """
+    return _HTML_INDENT_RE.sub('\n', _HTML_COMMENT_RE.sub('', markup))
+
+# 문서 시작 ~ 헤더 날짜 앞까지 (정적 문자열)
+_SAFE_HEAD = _compact_html("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -1607,7 +1794,10 @@ def create_email_safe_html(summary_data, hot_keyword=None):
                                 <h1 style="margin: 0 0 8px 0; font-size: 32px; font-weight: 700;">🔬 6G Technology Intelligence</h1>
                                 <p style="margin: 0; font-size: 16px; opacity: 0.9;">Professional Research Report for Engineers</p>
                                 <div style="display: inline-block; background: rgba(255,255,255,0.2); padding: 8px 20px; border-radius: 20px; margin-top: 16px; font-size: 14px;">
-                                    📅 {summary_data['generatedAt']}
+                                    📅 """)
+
+# 헤더 날짜 뒤 ~ 통계 표 시작
+_SAFE_HEAD_END = _compact_html("""
                                 </div>
                             </td>
                         </tr>
@@ -1617,38 +1807,26 @@ def create_email_safe_html(summary_data, hot_keyword=None):
                             <td style="padding: 30px; background: linear-gradient(to bottom, #f9fafb, white); border-bottom: 1px solid #e5e7eb;">
                                 <table width="100%" cellpadding="0" cellspacing="0">
                                     <tr>
-    """
-    
-    # 타입별 개수 계산
-    type_counts = {'Journal': 0, 'Paper': 0, 'News': 0}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        type_counts[item_type] = type_counts.get(item_type, 0) + 1
-    
-    stats = [
-        ('📚 Journals', type_counts.get('Journal', 0)),
-        ('📄 Papers', type_counts.get('Paper', 0)),
-        ('📰 News', type_counts.get('News', 0))
-    ]
-    
-    for label, count in stats:
-        html += f"""
+    """)
+
+# 통계 항목 (타입별 개수)
+_SAFE_STAT_TEMPLATE = _compact_html("""
                                         <td style="text-align: center; padding: 0 20px;">
                                             <div style="font-size: 36px; font-weight: 700; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">{count}</div>
                                             <div style="font-size: 13px; color: #6b7280; margin-top: 4px; font-weight: 500;">{label}</div>
                                         </td>
-        """
-    
-    html += """
+        """)
+
+# 통계 표 끝
+_SAFE_STATS_END = _compact_html("""
                                     </tr>
                                 </table>
                             </td>
                         </tr>
-    """
+    """)
 
-    # Hot Keyword 섹션 추가 (stats 다음)
-    if hot_keyword:
-        html += f"""
+# Hot Keyword 섹션 (stats 다음)
+_SAFE_HOT_KEYWORD_TEMPLATE = _compact_html("""
                         <!-- Hot Keyword 섹션 -->
                         <tr>
                             <td style="padding: 20px 30px; background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); border-bottom: 1px solid #e5e7eb;">
@@ -1662,87 +1840,59 @@ def create_email_safe_html(summary_data, hot_keyword=None):
                                 </table>
                             </td>
                         </tr>
-        """
+        """)
 
-    html += """
+# 컨텐츠 영역 시작
+_SAFE_CONTENT_START = _compact_html("""
                         <!-- 컨텐츠 영역 -->
                         <tr>
                             <td style="padding: 30px; background-color: #f9fafb;">
-    """
-    
-    # 타입별로 그룹핑
-    groups = {'Journal': [], 'Paper': [], 'News': []}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        groups[item_type].append(item)
-    
-    # 각 섹션 렌더링
-    section_titles = {
-        'Journal': '📚 Academic Journals',
-        'Paper': '📄 Research Papers',
-        'News': '📰 Industry News'
-    }
-    
-    for section_type in ['Journal', 'Paper', 'News']:
-        items = groups.get(section_type, [])
-        if not items:
-            continue
-        
-        color_config = colors[section_type]
-        
-        # 섹션 헤더
-        html += f"""
+    """)
+
+# 섹션 헤더
+_SAFE_SECTION_TEMPLATE = _compact_html("""
                                 <div style="display: flex; align-items: center; margin: 40px 0 24px 0; padding-bottom: 12px; border-bottom: 3px solid #e5e7eb;">
-                                    <span style="font-size: 28px;">{color_config['icon']}</span>
-                                    <span style="font-size: 22px; font-weight: 700; color: #1f2937; margin-left: 12px;">{section_titles[section_type]}</span>
-                                    <span style="margin-left: auto; background: #f3f4f6; color: #6b7280; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;">{len(items)} items</span>
+                                    <span style="font-size: 28px;">{icon}</span>
+                                    <span style="font-size: 22px; font-weight: 700; color: #1f2937; margin-left: 12px;">{section_title}</span>
+                                    <span style="margin-left: auto; background: #f3f4f6; color: #6b7280; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;">{count} items</span>
                                 </div>
-        """
-        
-        # 각 카드
-        for item in items:
-            # URL 유효성 재검증 (이메일 생성 시점에서 추가 검증)
-            item_url = validate_and_clean_url(item.get('url', ''))
+        """)
 
-            # URL이 유효하지 않으면 건너뛰기
-            if not item_url:
-                print(f"⚠️ 이메일 생성 중 유효하지 않은 URL 건너뛰기: {item.get('title', 'No title')[:50]}...")
-                continue
-
-            html += f"""
+# 카드 (아이템 1개) - 색상은 {primary}/{bg}, 아이템 값은 {{url}} 등 이중 중괄호 (섹션별로 2단계 format)
+_SAFE_CARD_TEMPLATE = _compact_html("""
                                 <!-- 카드 시작 -->
-                                <table width="100%" cellpadding="0" cellspacing="0" style="background: white; border-radius: 12px; margin-bottom: 20px; border: 2px solid #e5e7eb; box-shadow: 0 4px 6px rgba(0,0,0,0.07); border-left: 5px solid {color_config['primary']};">
+                                <table width="100%" cellpadding="0" cellspacing="0" style="background: white; border-radius: 12px; margin-bottom: 20px; border: 2px solid #e5e7eb; box-shadow: 0 4px 6px rgba(0,0,0,0.07); border-left: 5px solid {primary};">
                                     <tr>
                                         <td style="padding: 24px;">
 
                                             <!-- 타입 배지 -->
-                                            <div style="display: inline-block; padding: 6px 14px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-bottom: 12px; background: {color_config['bg']}; color: {color_config['primary']};">
-                                                {color_config['icon']} {color_config['label']}
+                                            <div style="display: inline-block; padding: 6px 14px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-bottom: 12px; background: {bg}; color: {primary};">
+                                                {icon} {label}
                                             </div>
 
                                             <!-- 제목 -->
                                             <h2 style="margin: 0 0 16px 0; font-size: 20px; font-weight: 700; color: #1f2937; line-height: 1.4;">
-                                                <a href="{item_url}" target="_blank" style="color: #1f2937; text-decoration: none;">{item['title']}</a>
+                                                <a href="{{url}}" target="_blank" style="color: #1f2937; text-decoration: none;">{{title}}</a>
                                             </h2>
 
                                             <!-- 요약 -->
-                                            <div style="color: #4b5563; font-size: 15px; line-height: 1.7; margin-bottom: 16px; padding: 16px; background: #f9fafb; border-radius: 8px; border-left: 3px solid {color_config['primary']};">
-                                                {item['summary']}
+                                            <div style="color: #4b5563; font-size: 15px; line-height: 1.7; margin-bottom: 16px; padding: 16px; background: #f9fafb; border-radius: 8px; border-left: 3px solid {primary};">
+                                                {{summary}}
                                             </div>
 
                                             <!-- 인사이트 -->
-                                            <div style="background: {color_config['bg']}; border-radius: 8px; padding: 16px; margin-top: 16px; border-left: 3px solid {color_config['primary']};">
-                                                <div style="font-weight: 700; color: {color_config['primary']}; font-size: 14px; margin-bottom: 8px;">
+                                            <div style="background: {bg}; border-radius: 8px; padding: 16px; margin-top: 16px; border-left: 3px solid {primary};">
+                                                <div style="font-weight: 700; color: {primary}; font-size: 14px; margin-bottom: 8px;">
                                                     💡 Engineer's Insight
                                                 </div>
                                                 <div style="color: #374151; font-size: 14px; line-height: 1.6;">
-                                                    {item['message']}
+                                                    {{message}}
                                                 </div>
                                             </div>
 
                                             <!-- 링크 버튼 -->
                                             <div style="margin-top: 16px;">
-                                                <a href="{item_url}" target="_blank" style="display: inline-block; padding: 10px 20px; background: {color_config['primary']}; color: white; text-decoration: none; border-radius: 8px; font-size: 14px; font-weight: 600;">
+                                                <a href="{{url}}" target="_blank" style="display: inline-block; padding: 10px 20px; background: {primary}; color: white; text-decoration: none; border-radius: 8px; font-size: 14px; font-weight: 600;">
                                                     Read Full Article →
                                                 </a>
                                             </div>
@@ -1751,9 +1901,34 @@ def create_email_safe_html(summary_data, hot_keyword=None):
                                     </tr>
                                 </table>
                                 <!-- 카드 끝 -->
-            """
-    
-    html += """
+            """)
+
+# 섹션(타입)별로 색상/아이콘을 미리 채워 둔 카드 템플릿 (아이템마다 색상 조회 생략)
+_SAFE_CARD_TEMPLATES = {
+    section_type: _SAFE_CARD_TEMPLATE.format(**color_config)
+    for section_type, color_config in SAFE_EMAIL_COLORS.items()
+}
+
+@functools.lru_cache(maxsize=256)
+def _safe_stats_fragment(journals, papers, news):
+    """통계 행 HTML (개수만으로 결정되므로 재렌더링 시 캐시 재사용)"""
+    return (
+        _SAFE_STAT_TEMPLATE.format(count=journals, label='📚 Journals')
+        + _SAFE_STAT_TEMPLATE.format(count=papers, label='📄 Papers')
+        + _SAFE_STAT_TEMPLATE.format(count=news, label='📰 News')
+    )
+
+@functools.lru_cache(maxsize=256)
+def _safe_section_header(section_type, count):
+    """섹션 헤더 HTML ((타입, 개수)만으로 결정되므로 캐시 재사용)"""
+    return _SAFE_SECTION_TEMPLATE.format(
+        icon=SAFE_EMAIL_COLORS[section_type]['icon'],
+        section_title=SAFE_EMAIL_SECTION_TITLES[section_type],
+        count=count
+    )
+
+# 컨텐츠 영역 끝 ~ 푸터 ~ 문서 끝
+_SAFE_FOOTER = _compact_html("""
                             </td>
                         </tr>
                         
@@ -1773,29 +1948,153 @@ def create_email_safe_html(summary_data, hot_keyword=None):
         
     </body>
     </html>
+    """)
+
+def create_email_safe_html(summary_data, hot_keyword=None):
+    """이메일 클라이언트 호환 HTML 생성
+
+    모듈 레벨 템플릿(_SAFE_*)에 값을 채워 넣으며, Gemini/피드에서 온 텍스트는
+    모두 이스케이프하여 제목의 '<', '&' 등이 마크업을 깨뜨리지 않도록 합니다.
     """
+    escape = html.escape
+    
+    # 정적 head는 상수 그대로, 날짜만 끼워 넣음
+    html_parts = [_SAFE_HEAD, escape(summary_data['generatedAt']), _SAFE_HEAD_END]
+    append = html_parts.append  # 루프 내 속성 조회 생략
+    
+    # 타입별 그룹 (요약 단계에서 만든 그룹 재사용, 개수는 그룹 길이로 계산)
+    groups = get_groups(summary_data)
+    
+    append(_safe_stats_fragment(
+        len(groups['Journal']), len(groups['Paper']), len(groups['News'])
+    ))
+    append(_SAFE_STATS_END)
+
+    # Hot Keyword 섹션 추가 (stats 다음)
+    if hot_keyword:
+        append(_SAFE_HOT_KEYWORD_TEMPLATE.format(hot_keyword=escape(hot_keyword)))
+
+    append(_SAFE_CONTENT_START)
     
-    return html
+    # 각 섹션 렌더링
+    for section_type, items in groups.items():
+        if not items:
+            continue
+        
+        card_template = _SAFE_CARD_TEMPLATES[section_type]
+        
+        # 섹션 헤더
+        append(_safe_section_header(section_type, len(items)))
+        
+        # 각 카드
+        for item in items:
+            # URL 유효성 재검증 (이메일 생성 시점에서 추가 검증)
+            item_url = validate_and_clean_url(item.get('url', ''))
+
+            # URL이 유효하지 않으면 건너뛰기
+            if not item_url:
+                print(f"⚠️ 이메일 생성 중 유효하지 않은 URL 건너뛰기: {item.get('title', 'No title')[:50]}...")
+                continue
+
+            append(card_template.format(
+                url=escape(item_url),
+                title=escape(item['title']),
+                summary=escape(item['summary']),
+                message=escape(item['message'])
+            ))
+    
+    append(_SAFE_FOOTER)
+    
+    return ''.join(html_parts)
+
+def smtp_connect(gmail_user, gmail_password):
+    """Gmail SMTP(SSL) 연결 및 로그인
+
+    Returns:
+        smtplib.SMTP_SSL: 로그인된 연결 (재사용 가능, with 문 지원)
+    """
+    server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
+    server.set_debuglevel(0)  # 디버그 비활성화
+    try:
+        server.login(gmail_user, gmail_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+# 프로세스 내에서 공유하는 SMTP 연결 (첫 전송 시 연결/로그인, 종료 시 atexit로 quit)
+_smtp_client = None
+_smtp_lock = threading.Lock()  # 이메일/텔레그램이 다른 스레드에서 동시에 전송됨
+
+def _send_with_shared_smtp(gmail_user, gmail_password, msg, to_addrs=None):
+    """공유 SMTP 연결로 메시지 전송 (끊긴 연결은 한 번만 재연결 후 재시도)"""
+    global _smtp_client
+    with _smtp_lock:
+        if _smtp_client is None:
+            _smtp_client = smtp_connect(gmail_user, gmail_password)
+        try:
+            _smtp_client.send_message(msg, to_addrs=to_addrs)
+        except smtplib.SMTPServerDisconnected:
+            # 유휴 시간 초과 등으로 서버가 끊은 경우
+            print("⚠️ SMTP 연결 끊김. 재연결 후 재시도...")
+            _smtp_client = smtp_connect(gmail_user, gmail_password)
+            _smtp_client.send_message(msg, to_addrs=to_addrs)
+
+def close_mailer():
+    """공유 SMTP 연결 종료 (atexit 등록, 여러 번 호출해도 안전)"""
+    global _smtp_client
+    with _smtp_lock:
+        if _smtp_client is not None:
+            try:
+                _smtp_client.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            _smtp_client = None
+
+atexit.register(close_mailer)
+
+def parse_recipients(value):
+    """RECIPIENT_EMAIL 값을 수신자 목록으로 변환 (쉼표/세미콜론 구분, 공백/중복 제거)
+
+    Args:
+        value: 환경변수 문자열 (예: "a@x.com, b@y.com")
+
+    Returns:
+        list: 순서를 유지한 수신자 주소 목록
+    """
+    if not value:
+        return []
+    return list(dict.fromkeys(
+        addr.strip() for addr in re.split(r'[,;]', value) if addr.strip()
+    ))
 
-# 기존 fetch_6g_professional.py의 send_email 함수를 이것으로 교체
 def send_email(summary_data, hot_keyword=None):
-    """시각적으로 개선된 이메일 전송"""
+    """시각적으로 개선된 이메일 전송
+
+    RECIPIENT_EMAIL에 여러 주소(쉼표 구분)가 있으면 HTML을 한 번만 렌더링하고
+    하나의 SMTP 트랜잭션으로 전송합니다 (수신자끼리 주소가 보이지 않도록 BCC).
+
+    Args:
+        summary_data: 요약 데이터
+        hot_keyword: 오늘의 Hot Keyword
+    """
     gmail_user = os.environ.get('GMAIL_USER')
     gmail_password = os.environ.get('GMAIL_APP_PASSWORD')
-    recipient = os.environ.get('RECIPIENT_EMAIL')
+    recipients = parse_recipients(os.environ.get('RECIPIENT_EMAIL'))
 
-    if not all([gmail_user, gmail_password, recipient]):
+    if not all([gmail_user, gmail_password, recipients]):
         missing = []
         if not gmail_user: missing.append('GMAIL_USER')
         if not gmail_password: missing.append('GMAIL_APP_PASSWORD')
-        if not recipient: missing.append('RECIPIENT_EMAIL')
+        if not recipients: missing.append('RECIPIENT_EMAIL')
         print(f"⚠️ 이메일 설정 없음: {', '.join(missing)}. 전송 생략.")
-        return
+        return None
 
     msg = MIMEMultipart('alternative')
     msg['Subject'] = f'🔬 6G Technology Intelligence Report - {summary_data["generatedAt"]}'
     msg['From'] = gmail_user
-    msg['To'] = recipient
+    # 수신자가 한 명이면 기존처럼 To, 여러 명이면 To는 발신자로 두고 봉투 주소로만 전달 (BCC)
+    msg['To'] = recipients[0] if len(recipients) == 1 else gmail_user
 
     # 새로운 시각적 HTML 사용
     html_body = create_email_safe_html(summary_data, hot_keyword=hot_keyword)
@@ -1804,13 +2103,12 @@ def send_email(summary_data, hot_keyword=None):
     try:
         print("📧 시각적으로 개선된 이메일 전송 중...")
         print(f"   발신: {gmail_user}")
-        print(f"   수신: {recipient}")
+        print(f"   수신: {', '.join(recipients)}")
 
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.set_debuglevel(0)  # 디버그 비활성화
-            server.login(gmail_user, gmail_password)
-            server.send_message(msg)
+        # 프로세스 공유 연결 재사용 (TLS 핸드셰이크 + AUTH는 첫 전송에서만)
+        _send_with_shared_smtp(gmail_user, gmail_password, msg, to_addrs=recipients)
         print("✅ 이메일 전송 완료")
+        return True
     except smtplib.SMTPAuthenticationError as e:
         print(f"❌ Gmail 인증 실패: {e}")
         print("\n💡 해결 방법:")
@@ -1820,6 +2118,7 @@ def send_email(summary_data, hot_keyword=None):
         print("4. 환경변수 확인: echo $GMAIL_APP_PASSWORD")
     except Exception as e:
         print(f"❌ 이메일 전송 오류: {e}")
+    return False
 
 
 # ==================== 텔레그램 전송 ====================
@@ -1831,139 +2130,111 @@ def send_email(summary_data, hot_keyword=None):
 - 읽기 쉬운 포맷
 """
 
+def telegram_escape(text):
+    """Telegram HTML 메시지용 텍스트 이스케이프 (&, <, >만 치환)
+
+    Telegram HTML parse mode는 본문에서 따옴표 이스케이프가 필요 없으므로
+    quote=False로 C 레벨 str.replace 3번만 수행합니다.
+    """
+    return html.escape(text, quote=False)
+
+# 텔레그램 요청 타임아웃 (연결, 읽기): 연결 지연은 빨리 실패하고 응답 대기는 충분히
+TELEGRAM_TIMEOUT = (3.05, 10)
+
+# 텔레그램 메시지 헤더 (통계) / 푸터
+_TELEGRAM_HEADER_TEMPLATE = (
+    "🔬 <b>6G Technology Intelligence Report</b>\n"
+    "📅 <i>{generated_at}</i>\n\n"
+    "📊 <b>Quick Summary</b>\n"
+    "├─ 📚 Journals: {journals}\n"
+    "├─ 📄 Papers: {papers}\n"
+    "└─ 📰 News: {news}\n\n"
+)
+_TELEGRAM_FOOTER = (
+    "\n━━━━━━━━━━━━━━━━━━━━\n\n"
+    "🤖 <i>Automated Report for 6G Engineers</i>\n"
+    "📧 <i>Full details in your email</i>"
+)
+
+# 텔레그램 아이템 1개 / 링크 줄 (URL 없는 아이템은 링크 줄 생략)
+_TELEGRAM_ITEM_TEMPLATE = "<b>{i}. {title}</b>\n\n{summary}...\n\n{link}─────────────\n\n"
+_TELEGRAM_LINK_TEMPLATE = "🔗 <a href=\"{url}\">{label}</a>\n\n"
+
+# 텔레그램 섹션별 (타입, 제목, 링크 문구, 요약 길이, 남은 개수 표시 여부)
+TELEGRAM_SECTIONS = (
+    ('Journal', "📚 <b>ACADEMIC JOURNALS</b>\n\n", "Read Article", 200, False),
+    ('Paper', "📄 <b>RESEARCH PAPERS</b>\n\n", "Read Paper", 200, False),
+    ('News', "📰 <b>INDUSTRY NEWS</b>\n\n", "Read News", 150, True),
+)
+
 def send_visual_telegram(summary_data, hot_keyword=None):
     """간소화된 텔레그램 메시지 전송 (title, summary, url 포맷)"""
 
-    import requests
-    import os
-    import html
-
     bot_token = os.environ.get('TELEGRAM_BOT_TOKEN')
     chat_id = os.environ.get('TELEGRAM_CHAT_ID')
 
     if not bot_token or not chat_id:
         print("⚠️ 텔레그램 설정 없음. 전송 생략.")
-        return
+        return None
 
-    # 타입별 그룹핑
-    groups = {'Journal': [], 'Paper': [], 'News': []}
-    for item in summary_data['summaries']:
-        item_type = item.get('type', 'News')
-        groups[item_type].append(item)
+    # 타입별 그룹 (요약 단계에서 만든 그룹 재사용, 개수는 그룹 길이로 계산)
+    groups = get_groups(summary_data)
 
-    # HTML 포맷으로 메시지 작성
+    # HTML 포맷으로 메시지 작성 (조각을 리스트에 모아 마지막에 한 번만 join)
     # 헤더와 통계
-    header = "🔬 <b>6G Technology Intelligence Report</b>\n"
-    header += f"📅 <i>{html.escape(summary_data['generatedAt'])}</i>\n\n"
-    header += "📊 <b>Quick Summary</b>\n"
-    header += f"├─ 📚 Journals: {len(groups['Journal'])}\n"
-    header += f"├─ 📄 Papers: {len(groups['Paper'])}\n"
-    header += f"└─ 📰 News: {len(groups['News'])}\n\n"
+    message_parts = [_TELEGRAM_HEADER_TEMPLATE.format(
+        generated_at=telegram_escape(summary_data['generatedAt']),
+        journals=len(groups['Journal']),
+        papers=len(groups['Paper']),
+        news=len(groups['News'])
+    )]
 
     # Hot Keyword 섹션
     if hot_keyword:
-        header += f"🔥 <b>Today's Hot Keyword:</b> <code>{html.escape(hot_keyword)}</code>\n\n"
-
-    header += "━━━━━━━━━━━━━━━━━━━━\n\n"
+        message_parts.append(f"🔥 <b>Today's Hot Keyword:</b> <code>{telegram_escape(hot_keyword)}</code>\n\n")
 
-    footer = "\n━━━━━━━━━━━━━━━━━━━━\n\n"
-    footer += "🤖 <i>Automated Report for 6G Engineers</i>\n"
-    footer += "📧 <i>Full details in your email</i>"
+    message_parts.append("━━━━━━━━━━━━━━━━━━━━\n\n")
+    append = message_parts.append  # 루프 내 속성 조회 생략
 
     # 텔레그램 메시지 길이 제한 (4096자)
     SAFE_LENGTH = 3500  # footer와 여유 공간 확보
 
-    message = header
-    content_parts = []
-
-    # Journal 섹션 (간소화된 포맷: title, summary, url)
-    if groups['Journal']:
-        section = "📚 <b>ACADEMIC JOURNALS</b>\n\n"
-        for i, item in enumerate(groups['Journal'], 1):
-            # Title
-            title = html.escape(item['title'][:100])
-            item_text = f"<b>{i}. {title}</b>\n\n"
-
-            # Summary
-            summary = html.escape(item['summary'][:200])
-            item_text += f"{summary}...\n\n"
-
-            # URL
-            if item.get('url'):
-                item_text += f"🔗 <a href=\"{item['url']}\">Read Article</a>\n\n"
-
-            item_text += "─────────────\n\n"
-
-            # 길이 체크
-            if len(message + section + item_text + footer) < SAFE_LENGTH:
-                section += item_text
-            else:
-                break
-
-        content_parts.append(section)
-
-    # Paper 섹션 (간소화된 포맷: title, summary, url)
-    if groups['Paper']:
-        section = "📄 <b>RESEARCH PAPERS</b>\n\n"
-        for i, item in enumerate(groups['Paper'], 1):
-            # Title
-            title = html.escape(item['title'][:100])
-            item_text = f"<b>{i}. {title}</b>\n\n"
-
-            # Summary
-            summary = html.escape(item['summary'][:200])
-            item_text += f"{summary}...\n\n"
-
-            # URL
-            if item.get('url'):
-                item_text += f"🔗 <a href=\"{item['url']}\">Read Paper</a>\n\n"
-
-            item_text += "─────────────\n\n"
-
-            # 길이 체크
-            current_content = ''.join(content_parts) + section + item_text
-            if len(message + current_content + footer) < SAFE_LENGTH:
-                section += item_text
-            else:
-                break
-
-        content_parts.append(section)
-
-    # News 섹션 (간소화된 포맷: title, summary, url)
-    if groups['News']:
-        section = "📰 <b>INDUSTRY NEWS</b>\n\n"
-        news_count = 0
-        for i, item in enumerate(groups['News'], 1):
-            # Title
-            title = html.escape(item['title'][:100])
-            item_text = f"<b>{i}. {title}</b>\n\n"
-
-            # Summary
-            summary = html.escape(item['summary'][:150])
-            item_text += f"{summary}...\n\n"
+    # 섹션별로 이스케이프/자르기를 한 번에 처리하고, 아이템 루프에서는 포맷만 수행
+    # used_length: 지금까지 담은 조각 + footer 길이 (매번 join하지 않고 누적)
+    used_length = sum(map(len, message_parts)) + len(_TELEGRAM_FOOTER)
+    for item_type, heading, link_label, summary_length, show_remaining in TELEGRAM_SECTIONS:
+        items = groups[item_type]
+        if not items:
+            continue
 
-            # URL
-            if item.get('url'):
-                item_text += f"🔗 <a href=\"{item['url']}\">Read News</a>\n\n"
+        escaped = [
+            (telegram_escape(item['title'][:100]), telegram_escape(item['summary'][:summary_length]), item.get('url'))
+            for item in items
+        ]
 
-            item_text += "─────────────\n\n"
+        append(heading)
+        used_length += len(heading)
+        shown = 0
+        for i, (title, summary, url) in enumerate(escaped, 1):
+            link = _TELEGRAM_LINK_TEMPLATE.format(url=url, label=link_label) if url else ""
+            item_text = _TELEGRAM_ITEM_TEMPLATE.format(i=i, title=title, summary=summary, link=link)
 
             # 길이 체크
-            current_content = ''.join(content_parts) + section + item_text
-            if len(message + current_content + footer) < SAFE_LENGTH:
-                section += item_text
-                news_count += 1
+            if used_length + len(item_text) < SAFE_LENGTH:
+                append(item_text)
+                used_length += len(item_text)
+                shown += 1
             else:
                 break
 
-        if len(groups['News']) > news_count:
-            section += f"<i>... and {len(groups['News']) - news_count} more news items</i>\n\n"
-
-        content_parts.append(section)
+        if show_remaining and len(items) > shown:
+            remaining = f"<i>... and {len(items) - shown} more news items</i>\n\n"
+            append(remaining)
+            used_length += len(remaining)
 
     # 최종 메시지 조립
-    message += ''.join(content_parts)
-    message += footer
+    append(_TELEGRAM_FOOTER)
+    message = ''.join(message_parts)
 
     # 전송
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
@@ -1976,69 +2247,82 @@ def send_visual_telegram(summary_data, hot_keyword=None):
 
     try:
         print("📱 간소화된 텔레그램 메시지 전송 중...")
-        response = requests.post(url, json=payload, timeout=10)
+        response = _HTTP.post(
+            url,
+            data=json_dumps_bytes(payload),
+            headers={'Content-Type': 'application/json'},
+            timeout=TELEGRAM_TIMEOUT
+        )
         response.raise_for_status()
         print("✅ 텔레그램 전송 완료")
+        return True
     except Exception as e:
         print(f"❌ 텔레그램 오류: {e}")
         if hasattr(e, 'response') and e.response is not None:
             print(f"응답: {e.response.text}")
+    return False
 
 # ==================== 파일 저장 ====================
 
+# Markdown 리포트 섹션 제목
+REPORT_SECTION_HEADINGS = {
+    'Journal': "## 📚 Academic Journals\n\n",
+    'Paper': "## 📄 Research Papers\n\n",
+    'News': "## 📰 Industry News\n\n"
+}
+
 def save_to_file(summary_data):
-    """Markdown 파일로 저장"""
+    """Markdown 파일로 저장 (메모리에서 조립 후 한 번에 기록)"""
     
     os.makedirs('output', exist_ok=True)
     filename = f"output/6g_report_{summary_data['generatedAt']}.md"
     
+    parts = [
+        f"# 6G Technology Intelligence Report\n\n",
+        f"**Generated**: {summary_data['generatedAt']}\n",
+        f"**Persona**: 6G Technology Engineer\n\n",
+        "---\n\n"
+    ]
+    append = parts.append
+    
+    # 타입별 그룹 (요약 단계에서 만든 그룹 재사용)
+    groups = get_groups(summary_data)
+    
+    for section_type, items in groups.items():
+        if not items:
+            continue
+        append(REPORT_SECTION_HEADINGS[section_type])
+        for i, item in enumerate(items, 1):
+            title = item['title']
+            append(
+                f"### {i}. {title}\n\n"
+                f"**제목**: {title}\n\n"
+                f"**요약한 내용**:\n{item['summary']}\n\n"
+                f"**우리에게 주는 메시지**:\n{item['message']}\n\n"
+                f"**출처링크**: {item['url']}\n\n"
+                "---\n\n"
+            )
+    
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"# 6G Technology Intelligence Report\n\n")
-        f.write(f"**Generated**: {summary_data['generatedAt']}\n")
-        f.write(f"**Persona**: 6G Technology Engineer\n\n")
-        f.write("---\n\n")
-        
-        # 타입별 그룹핑
-        groups = {'Journal': [], 'Paper': [], 'News': []}
-        for item in summary_data['summaries']:
-            item_type = item.get('type', 'News')
-            groups[item_type].append(item)
-        
-        # Journal
-        if groups['Journal']:
-            f.write("## 📚 Academic Journals\n\n")
-            for i, item in enumerate(groups['Journal'], 1):
-                f.write(f"### {i}. {item['title']}\n\n")
-                f.write(f"**제목**: {item['title']}\n\n")
-                f.write(f"**요약한 내용**:\n{item['summary']}\n\n")
-                f.write(f"**우리에게 주는 메시지**:\n{item['message']}\n\n")
-                f.write(f"**출처링크**: {item['url']}\n\n")
-                f.write("---\n\n")
-        
-        # Paper
-        if groups['Paper']:
-            f.write("## 📄 Research Papers\n\n")
-            for i, item in enumerate(groups['Paper'], 1):
-                f.write(f"### {i}. {item['title']}\n\n")
-                f.write(f"**제목**: {item['title']}\n\n")
-                f.write(f"**요약한 내용**:\n{item['summary']}\n\n")
-                f.write(f"**우리에게 주는 메시지**:\n{item['message']}\n\n")
-                f.write(f"**출처링크**: {item['url']}\n\n")
-                f.write("---\n\n")
-        
-        # News
-        if groups['News']:
-            f.write("## 📰 Industry News\n\n")
-            for i, item in enumerate(groups['News'], 1):
-                f.write(f"### {i}. {item['title']}\n\n")
-                f.write(f"**제목**: {item['title']}\n\n")
-                f.write(f"**요약한 내용**:\n{item['summary']}\n\n")
-                f.write(f"**우리에게 주는 메시지**:\n{item['message']}\n\n")
-                f.write(f"**출처링크**: {item['url']}\n\n")
-                f.write("---\n\n")
+        f.write(''.join(parts))
     
     print(f"✅ 파일 저장 완료: {filename}")
 
+# ==================== 중복 전송 방지 ====================
+
+# 마지막으로 전송한 리포트 해시의 캐시 키
+LAST_DELIVERY_CACHE_KEY = make_cache_key('last_delivered_report')
+
+def report_fingerprint(summary_data, hot_keyword=None):
+    """리포트 내용 해시 (생성 날짜/그룹 제외, 키워드 + 요약 본문 기준)"""
+    return make_cache_key('report', hot_keyword, summary_data['summaries'])
+
+def is_already_delivered(fingerprint):
+    """같은 내용의 리포트를 이미 전송했는지 확인 (FORCE_SEND=1 이면 항상 False)"""
+    if os.environ.get('FORCE_SEND', '').lower() in ('1', 'true', 'yes'):
+        return False
+    return cache_get(LAST_DELIVERY_CACHE_KEY) == fingerprint
+
 # ==================== 메인 함수 ====================
 
 def main():
@@ -2063,27 +2347,8 @@ def main():
         print("\n" + "="*70)
         print("STEP 2: 데이터 수집 (각 소스 10개씩)")
         print("="*70)
-        all_items = []
-
-        # IEEE Journals (10개)
-        journals = search_ieee(hot_keyword, num_results=10)
-        all_items.extend(journals)
-
-        # arXiv Papers (10개)
-        papers_arxiv = search_arxiv(hot_keyword, num_results=10)
-        all_items.extend(papers_arxiv)
-
-        # Google Scholar Papers - DISABLED (bot detection issues)
-        # papers_scholar = search_google_scholar(hot_keyword, num_results=10)
-        # all_items.extend(papers_scholar)
-
-        # Google News (5개)
-        news_google = search_google_news(hot_keyword, num_results=5)
-        all_items.extend(news_google)
-
-        # The Verge (5개)
-        news_verge = search_the_verge(hot_keyword, num_results=5)
-        all_items.extend(news_verge)
+        journals, papers_arxiv, news_google, news_verge = collect_items_concurrently(hot_keyword)
+        all_items = journals + papers_arxiv + news_google + news_verge
 
         print(f"\n✅ 총 {len(all_items)}개 자료 수집 완료")
         print(f"  📚 IEEE Journals: {len(journals)}개")
@@ -2123,11 +2388,23 @@ def main():
         print("="*70)
         save_to_file(summary_data)
 
-        # Step 6: 이메일 전송
-        send_email(summary_data, hot_keyword=hot_keyword)
+        # 이전 실행과 내용이 같으면 (캐시 적중 재실행 등) 같은 리포트를 다시 보내지 않음
+        fingerprint = report_fingerprint(summary_data, hot_keyword)
+        if is_already_delivered(fingerprint):
+            print("⏭️ 이전에 전송한 리포트와 내용이 같아 이메일/텔레그램 전송 생략 (FORCE_SEND=1로 강제 전송)")
+            return
 
-        # Step 7: 텔레그램 전송
-        send_visual_telegram(summary_data, hot_keyword=hot_keyword)
+        # Step 6-7: 이메일/텔레그램 전송 (서로 독립된 네트워크 I/O이므로 동시에 실행)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(send_email, summary_data, hot_keyword=hot_keyword),
+                executor.submit(send_visual_telegram, summary_data, hot_keyword=hot_keyword),
+            ]
+            results = [future.result() for future in futures]
+
+        # 설정된 채널이 모두 성공했을 때만 기록 (실패한 채널은 다음 실행에서 재시도)
+        if True in results and False not in results:
+            cache_set(LAST_DELIVERY_CACHE_KEY, fingerprint, DELIVERY_CACHE_TTL)
 
         print("\n" + "="*70)
         print("✅ 모든 작업 완료!")
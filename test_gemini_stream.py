@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Gemini 스트리밍(SSE) 파싱 테스트 (네트워크 불필요)
+"""
+
+import sys
+import os
+import json
+
+# 메인 스크립트의 함수를 import (복사본 대신 실제 구현을 검증)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+from fetch_6g_professional import is_json_complete, read_gemini_stream
+from gemini_fakes import FakeStreamResponse, text_event
+
+
+print("=" * 70)
+print("Gemini 스트리밍 파싱 테스트")
+print("=" * 70)
+
+all_correct = True
+
+
+def check(name, actual, expected):
+    global all_correct
+    if actual == expected:
+        print(f"✅ {name}")
+    else:
+        print(f"❌ {name}")
+        print(f"   기대: {expected!r}")
+        print(f"   실제: {actual!r}")
+        all_correct = False
+
+
+# 1. is_json_complete: 문자열 내부 괄호/이스케이프된 따옴표는 무시
+print("\n[is_json_complete]")
+check("닫히지 않은 배열", is_json_complete('[{"title": "a"'), False)
+check("닫힌 배열", is_json_complete('[{"title": "a"}]'), True)
+check("문자열 안의 닫는 괄호 무시", is_json_complete('[{"title": "a]}"'), False)
+check("이스케이프된 따옴표 뒤 괄호 무시", is_json_complete('[{"title": "say \\"hi]\\" '), False)
+check("이스케이프된 따옴표 후 닫힘", is_json_complete('[{"title": "say \\"hi\\""}]'), True)
+check("JSON 앞 설명 문장의 따옴표 무시", is_json_complete('결과 "요약": ```json\n{"a": 1}'), True)
+
+# 2. 여러 data: 이벤트로 쪼개진 JSON 이어 붙이기 + thought part 제외
+print("\n[read_gemini_stream]")
+response = FakeStreamResponse([
+    text_event(('먼저 기사를 분석해 보자 [', True)),
+    text_event(('[{"title": "6G {RAN}', False)),
+    text_event(('", "url": "https://ex.com/a\\"]"', False)),
+    text_event(('}', False), ('사고 과정 ]', True)),
+    text_event((']', False)),
+    text_event(('\n추가 설명', False), finish_reason='STOP'),
+])
+text, finish_reason = read_gemini_stream(response)
+expected_text = '[{"title": "6G {RAN}", "url": "https://ex.com/a\\"]"}]'
+check("쪼개진 텍스트 조각 결합 (thought 제외)", text, expected_text)
+check("결합된 텍스트가 유효한 JSON", json.loads(text)[0]['url'], 'https://ex.com/a"]')
+check("JSON이 닫히면 finishReason 없이 JSON_COMPLETE", finish_reason, 'JSON_COMPLETE')
+check("JSON이 닫힌 뒤 남은 이벤트는 읽지 않음", response.consumed, 9)
+check("조기 종료 시 응답 연결 닫힘", response.closed, True)
+
+# 3. 스트림 끝까지 JSON이 닫히지 않으면 마지막 finishReason 유지
+response = FakeStreamResponse([
+    text_event(('[{"title": "잘린 응답', False)),
+    text_event(('", "url": "', False), finish_reason='MAX_TOKENS'),
+])
+text, finish_reason = read_gemini_stream(response)
+check("잘린 응답 텍스트 보존", text, '[{"title": "잘린 응답", "url": "')
+check("잘린 응답 finishReason", finish_reason, 'MAX_TOKENS')
+check("스트림 전체 소비", response.consumed, len(response.lines))
+check("정상 종료 시 응답 연결 닫힘", response.closed, True)
+
+if all_correct:
+    print("\n✅ 모든 스트리밍 파싱 검증을 통과했습니다!")
+else:
+    print("\n❌ 일부 스트리밍 파싱 검증에 실패했습니다.")
+    sys.exit(1)
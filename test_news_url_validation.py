@@ -6,10 +6,40 @@
 - 문제가 있는 URL 진단 및 보고
 """
 
+import io
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import re
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+# 모든 요청이 공유하는 HTTP 세션 (같은 호스트에 대한 TCP/TLS 연결 재사용)
+_HTTP = requests.Session()
+_HTTP.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Atom 네임스페이스 (The Verge 피드)
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+def iter_xml_elements(content, tag):
+    """XML 바이트에서 tag 요소를 스트리밍으로 순회 (메인 스크립트와 동일)
+
+    처리가 끝난 요소는 즉시 비워서 전체 트리를 메모리에 유지하지 않습니다.
+    """
+    for _, elem in etree.iterparse(io.BytesIO(content), tag=tag):
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+# 기본 URL 구조 검증 정규식 (모듈 로드 시 한 번만 컴파일)
+_URL_PATTERN = re.compile(
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
 
 def validate_and_clean_url(url):
     """URL 유효성 검증 및 정제 (메인 스크립트와 동일)"""
@@ -22,15 +52,7 @@ def validate_and_clean_url(url):
         if not url.startswith(('http://', 'https://')):
             return ''
 
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-            r'localhost|'
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        if not url_pattern.match(url):
+        if not _URL_PATTERN.match(url):
             return ''
 
         return url
@@ -76,24 +98,23 @@ def test_google_news_urls(query="6G wireless", num_results=5):
     url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
 
     try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=10)
+        response = _HTTP.get(url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('item', limit=num_results)
-
+        # RSS <item>을 lxml로 스트리밍 파싱 (BeautifulSoup 'xml' 트리 생성 생략)
         results = []
-        for i, item in enumerate(items, 1):
-            title = item.title.text if item.title else 'No title'
+        for i, item in enumerate(iter_xml_elements(response.content, 'item'), 1):
+            if i > num_results:
+                break
+
+            title = item.findtext('title', 'No title')
 
             # Method 1: Extract from <source> tag
             source_tag = item.find('source')
-            source_url = source_tag.get('url') if source_tag else None
+            source_url = source_tag.get('url') if source_tag is not None else None
 
             # Method 2: Extract from <link> tag (Google redirect)
-            link_url = item.link.text if item.link else None
+            link_url = item.findtext('link')
 
             # Validate both URLs
             validated_source = validate_and_clean_url(source_url) if source_url else ''
@@ -159,30 +180,29 @@ def test_verge_urls(query="6G wireless", num_results=5):
     url = "https://www.theverge.com/rss/index.xml"
 
     try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=10)
+        response = _HTTP.get(url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'xml')
-        entries = soup.find_all('entry')
-
         results = []
         query_lower = query.lower()
 
-        for entry in entries:
+        # Atom <entry>를 lxml로 스트리밍 파싱
+        for entry in iter_xml_elements(response.content, f'{ATOM_NS}entry'):
             if len(results) >= num_results:
                 break
 
-            title = entry.find('title').text if entry.find('title') else ''
-            summary_elem = entry.find('summary')
-            content_elem = entry.find('content')
+            title = entry.findtext(f'{ATOM_NS}title', '')
+            summary_elem = entry.find(f'{ATOM_NS}summary')
+            content_elem = entry.find(f'{ATOM_NS}content')
 
             description = ''
-            if summary_elem:
-                description = summary_elem.text
-            elif content_elem:
-                description = BeautifulSoup(content_elem.text, 'html.parser').get_text()
+            summary_text = ''.join(summary_elem.itertext()) if summary_elem is not None else ''
+            if summary_text.strip():
+                description = summary_text
+            elif content_elem is not None:
+                content_html = ''.join(content_elem.itertext())
+                if content_html.strip():
+                    description = lxml_html.fromstring(content_html).text_content()
 
             # Filter by query
             text_to_search = (title + ' ' + description).lower()
@@ -192,11 +212,10 @@ def test_verge_urls(query="6G wireless", num_results=5):
                 continue
 
             # Extract URL
-            link_elem = entry.find('link', {'rel': 'alternate'})
-            if not link_elem:
-                link_elem = entry.find('link')
+            links = entry.findall(f'{ATOM_NS}link')
+            link_elem = next((link for link in links if link.get('rel') == 'alternate'), links[0] if links else None)
 
-            extracted_url = link_elem.get('href') if link_elem else ''
+            extracted_url = link_elem.get('href') if link_elem is not None else ''
             validated_url = validate_and_clean_url(extracted_url)
 
             # Check if homepage
@@ -240,9 +259,7 @@ def test_verge_urls(query="6G wireless", num_results=5):
 def test_url_accessibility(url, timeout=5):
     """URL이 실제로 접근 가능한지 테스트 (HTTP HEAD 요청)"""
     try:
-        response = requests.head(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=timeout, allow_redirects=True)
+        response = _HTTP.head(url, timeout=timeout, allow_redirects=True)
 
         # 최종 URL (리다이렉트 후)
         final_url = response.url
@@ -318,9 +335,13 @@ def main():
     if verge_results:
         sample_urls.extend([r['url'] for r in verge_results[:2] if r['url']])
 
-    for i, url in enumerate(sample_urls[:3], 1):
+    # HEAD 요청은 서로 독립적이므로 동시에 보내고, 결과는 원래 순서대로 출력
+    sample_urls = sample_urls[:3]
+    with ThreadPoolExecutor(max_workers=len(sample_urls) or 1) as executor:
+        access_results = list(executor.map(lambda u: test_url_accessibility(u, timeout=5), sample_urls))
+
+    for i, (url, access_info) in enumerate(zip(sample_urls, access_results), 1):
         print(f"\n{i}. 테스트 중: {url[:60]}...")
-        access_info = test_url_accessibility(url, timeout=5)
 
         if access_info['accessible']:
             print(f"   ✅ 접근 가능 (HTTP {access_info['status_code']})")
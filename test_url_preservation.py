@@ -3,37 +3,12 @@
 URL 보존 로직 테스트
 """
 
-# 테스트용 헬퍼 함수 복사
-def _preserve_original_urls(summaries, original_items):
-    """
-    Gemini 응답에서 URL이 잘못되었을 경우 원본 아이템의 URL을 복원
+import sys
+import os
 
-    Args:
-        summaries: Gemini가 반환한 요약 결과 리스트
-        original_items: 원본 아이템 리스트
-    """
-    # 원본 아이템을 title로 매핑
-    original_map = {}
-    for item in original_items:
-        # title을 정규화 (공백, 특수문자 제거)
-        normalized_title = item['title'].lower().strip()
-        original_map[normalized_title] = item['url']
-
-    # 각 요약 아이템의 URL을 원본에서 복원
-    for summary in summaries:
-        summary_title = summary.get('title', '').lower().strip()
-
-        # 정확히 일치하는 title 찾기
-        if summary_title in original_map:
-            summary['url'] = original_map[summary_title]
-            continue
-
-        # 부분 일치 시도 (title이 일부만 포함된 경우)
-        for orig_title, orig_url in original_map.items():
-            # 양방향 부분 일치 확인
-            if (summary_title in orig_title or orig_title in summary_title) and len(summary_title) > 20:
-                summary['url'] = orig_url
-                break
+# 메인 스크립트의 함수를 import (복사본 대신 실제 구현을 검증)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+from fetch_6g_professional import _preserve_original_urls
 
 # 테스트 데이터
 original_items = [
@@ -51,6 +26,21 @@ original_items = [
         'title': "'NVIDIA Aerial' 확장이 불러올 통신 분야의 혁신",
         'url': 'https://blogs.nvidia.co.kr/actual-article-url-3',
         'type': 'News'
+    },
+    {
+        'title': '6G 표준화 앞둔 3GPP, AI-RAN 공동 연구 본격화',
+        'url': 'https://www.etnews.com/actual-article-url-4',
+        'type': 'News'
+    },
+    {
+        'title': 'Ericsson, 6G 주파수 공유 기술 시연 성공',
+        'url': 'https://www.ericsson.com/ko/news/actual-article-url-5',
+        'type': 'News'
+    },
+    {
+        'title': 'KT, 오픈랜 기반 AI 기지국 실증 완료',
+        'url': 'https://www.kt.com/news/actual-article-url-6',
+        'type': 'News'
     }
 ]
 
@@ -76,6 +66,27 @@ summaries = [
         'summary': '테스트 요약 3',
         'message': '테스트 메시지 3',
         'type': 'News'
+    },
+    {
+        'title': '6G 표준화 앞둔 3GPP - AI-RAN 공동연구 본격화',  # 구두점/띄어쓰기가 바뀐 제목
+        'url': '',  # URL 누락
+        'summary': '테스트 요약 4',
+        'message': '테스트 메시지 4',
+        'type': 'News'
+    },
+    {
+        'title': '에릭슨 6G 시연',  # 제목을 바꿔 씀 (제목 근거 없음 → 호스트로 복원)
+        'url': 'https://www.ericsson.com',  # 잘못된 대표 URL
+        'summary': '테스트 요약 5',
+        'message': '테스트 메시지 5',
+        'type': 'News'
+    },
+    {
+        'title': 'KT, 오픈랜 기반 AI 기지국 실증 완료 (종합)',  # 부제가 붙은 제목 (부분 일치)
+        'url': 'https://www.ericsson.com',  # 다른 기사의 호스트 (제목 근거가 우선)
+        'summary': '테스트 요약 6',
+        'message': '테스트 메시지 6',
+        'type': 'News'
     }
 ]
 
@@ -110,7 +121,27 @@ for i, (summary, original) in enumerate(zip(summaries, original_items), 1):
         print(f"   실제: {summary['url']}")
         all_correct = False
 
+# 제목 근거 없이 같은 호스트의 다른 경로 URL만 있는 요약은 복원하지 않음
+# (호스트에 원본이 하나뿐이어도 다른 기사일 수 있으므로 원본 URL로 바꾸지 않음)
+unrelated_url = 'https://www.ericsson.com/ko/news/some-other-article'
+unrelated = [{
+    'title': '노키아, 위성 백홀 신제품 발표',
+    'url': unrelated_url,
+    'summary': '테스트 요약 7',
+    'message': '테스트 메시지 7',
+    'type': 'News'
+}]
+_preserve_original_urls(unrelated, original_items)
+if unrelated[0]['url'] == unrelated_url:
+    print("✅ 7번 아이템: 같은 호스트의 다른 경로 URL은 복원하지 않음")
+else:
+    print("❌ 7번 아이템: 관련 없는 원본 URL로 잘못 복원됨")
+    print(f"   기대: {unrelated_url}")
+    print(f"   실제: {unrelated[0]['url']}")
+    all_correct = False
+
 if all_correct:
     print("\n✅ 모든 URL이 정확히 복원되었습니다!")
 else:
     print("\n❌ 일부 URL 복원에 실패했습니다.")
+    sys.exit(1)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+The Verge Atom 엔트리 파싱 테스트 (네트워크 불필요)
+"""
+
+import sys
+import os
+
+# 메인 스크립트의 함수를 import (복사본 대신 실제 구현을 검증)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+from fetch_6g_professional import ATOM_NS, _extract_verge_entry, iter_xml_elements
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Empty summary, HTML content</title>
+    <summary/>
+    <content type="html">&lt;p&gt;Operators trial &lt;b&gt;6G&lt;/b&gt; spectrum sharing&lt;/p&gt;</content>
+    <link rel="alternate" href="https://www.theverge.com/2026/10/14/empty-summary"/>
+  </entry>
+  <entry>
+    <title>Whitespace summary, HTML content</title>
+    <summary>   </summary>
+    <content type="html">&lt;p&gt;Open RAN radios ship&lt;/p&gt;</content>
+    <link href="https://www.theverge.com/2026/10/14/whitespace-summary"/>
+  </entry>
+  <entry>
+    <title>Summary wins over content</title>
+    <summary>AI-RAN pilot announced</summary>
+    <content type="html">&lt;p&gt;ignored&lt;/p&gt;</content>
+    <link rel="alternate" href="https://www.theverge.com/2026/10/14/summary"/>
+  </entry>
+  <entry>
+    <title>No summary, no content</title>
+    <link rel="alternate" href="https://www.theverge.com/2026/10/14/nothing"/>
+  </entry>
+</feed>
+"""
+
+expected = [
+    'Operators trial 6G spectrum sharing',
+    'Open RAN radios ship',
+    'AI-RAN pilot announced',
+    'No description',
+]
+
+print("=" * 70)
+print("The Verge 엔트리 파싱 테스트")
+print("=" * 70)
+
+entries = [_extract_verge_entry(entry) for entry in iter_xml_elements(FEED, f'{ATOM_NS}entry')]
+
+all_correct = len(entries) == len(expected)
+if not all_correct:
+    print(f"❌ 엔트리 수 불일치: 기대 {len(expected)}, 실제 {len(entries)}")
+
+for i, (entry, description) in enumerate(zip(entries, expected), 1):
+    if entry['description'] == description:
+        print(f"✅ {i}번 엔트리: {entry['title']}")
+    else:
+        print(f"❌ {i}번 엔트리: {entry['title']}")
+        print(f"   기대: {description!r}")
+        print(f"   실제: {entry['description']!r}")
+        all_correct = False
+
+if all_correct:
+    print("\n✅ 모든 엔트리 설명이 올바르게 추출되었습니다!")
+else:
+    print("\n❌ 일부 엔트리 설명 추출에 실패했습니다.")
+    sys.exit(1)